@@ -188,7 +188,7 @@ def get_drive_service_oauth():
                 "https://www.googleapis.com/auth/documents",
             ],
         )
-        drv = build("drive","v3",credentials=creds, cache_discovery=False)
+        drv = build("drive","v3",credentials=creds, static_discovery=True)
         about = drv.about().get(fields="user").execute()
         email = about["user"]["emailAddress"]
         print(f"[google] OAuth OK; acting as: {email}")
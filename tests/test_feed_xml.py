@@ -0,0 +1,83 @@
+import os, sys
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "workers"))
+from feed_xml import parse_feed_items
+
+
+def iso(s):
+    return datetime.fromisoformat(s.replace("Z", "+00:00"))
+
+RSS = b"""<?xml version="1.0"?>
+<rss version="2.0" xmlns:atom="http://www.w3.org/2005/Atom"
+     xmlns:dc="http://purl.org/dc/elements/1.1/"
+     xmlns:content="http://purl.org/rss/1.0/modules/content/">
+<channel><title>c</title>
+  <item>
+    <title>Comment<!-- editor note --> test</title>
+    <atom:link rel="self" href="" />
+    <link>https://example.com/a</link>
+    <pubDate>2025-08-20T10:00:00Z</pubDate>
+    <description>Plain summary</description>
+  </item>
+  <item>
+    <title>Relative <b>bold</b></title>
+    <link>/b.html</link>
+    <dc:date>2025-08-21T00:00:00Z</dc:date>
+    <content:encoded><![CDATA[<p>Encoded</p>]]></content:encoded>
+  </item>
+  <item>
+    <title>Permalink guid</title>
+    <guid>https://example.com/c</guid>
+  </item>
+  <item>
+    <title>Opaque guid</title>
+    <guid isPermaLink="false">tag:abc</guid>
+  </item>
+</channel></rss>"""
+
+ATOM = b"""<?xml version="1.0"?>
+<feed xmlns="http://www.w3.org/2005/Atom"><title>f</title>
+  <entry>
+    <title type="xhtml"><div xmlns="http://www.w3.org/1999/xhtml">Atom <em>title</em></div></title>
+    <link rel="related" href="https://example.com/related" />
+    <link href="https://example.com/x" />
+    <id>urn:uuid:1</id>
+    <published>2025-08-19T08:00:00Z</published>
+    <updated>2025-08-22T08:00:00Z</updated>
+    <content type="xhtml"><div xmlns="http://www.w3.org/1999/xhtml"><p>Hello <b>world</b></p></div></content>
+  </entry>
+  <entry>
+    <title>Only an id</title>
+    <id>tag:example.com,2025:2</id>
+    <updated>2025-08-22T08:00:00Z</updated>
+  </entry>
+</feed>"""
+
+
+def test_rss_items():
+    items = parse_feed_items(RSS, iso, base="https://example.com/feed.xml")
+    assert [(e["title"], e["link"]) for e in items] == [
+        ("Comment test", "https://example.com/a"),
+        ("Relative bold", "https://example.com/b.html"),
+        ("Permalink guid", "https://example.com/c"),
+    ]
+    assert items[0]["published"] == iso("2025-08-20T10:00:00Z")
+    assert items[1]["published"] == iso("2025-08-21T00:00:00Z")  # dc:date
+    assert items[2]["published"] is None
+    assert items[0]["summary"] == "Plain summary"
+    assert items[1]["summary"] == "<p>Encoded</p>"
+
+
+def test_atom_entries():
+    items = parse_feed_items(ATOM, iso)
+    assert len(items) == 1  # an Atom id is not a link
+    e = items[0]
+    assert e["title"] == "Atom title"
+    assert e["link"] == "https://example.com/x"
+    assert e["published"] == iso("2025-08-19T08:00:00Z")  # published wins over updated
+    assert e["summary"] == "Hello world"
+
+
+def test_relative_link_without_base_is_dropped():
+    assert parse_feed_items(RSS, iso)[1]["title"] == "Permalink guid"
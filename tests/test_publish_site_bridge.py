@@ -0,0 +1,22 @@
+import json, os, sys
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "workers"))
+import publish_site_bridge as bridge
+
+
+def test_key_items_tied_scores_newest_first(tmp_path, monkeypatch):
+    now = datetime.now(timezone.utc)
+    os.makedirs(tmp_path / "outputs" / "docs")
+    with open(tmp_path / "outputs" / "docs" / "2026-01.ndjson", "w", encoding="utf-8") as f:
+        # Oldest first in the file, every record with the same score
+        for i in range(60):
+            f.write(json.dumps({
+                "schema": "document.v2", "title": f"t{i}", "url": f"u{i}", "source_id": "eib_press",
+                "published_date": (now - timedelta(hours=60 - i)).isoformat(),
+            }) + "\n")
+    monkeypatch.chdir(tmp_path)
+    bridge.main()
+    with open(tmp_path / "docs" / "site" / "key-items.json", encoding="utf-8") as f:
+        titles = [it["title"] for it in json.load(f)["items"]]
+    assert titles == [f"t{i}" for i in range(59, 39, -1)]
@@ -28,11 +28,17 @@ Env (provided by workflow):
 
 from __future__ import annotations
 
-import os, re, smtplib, pathlib, datetime as dt
+import io, os, re, json, time, heapq, shutil, calendar, hashlib, smtplib, pathlib, email.utils, datetime as dt
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Any, Dict, List, Tuple
 from email.mime.text import MIMEText
+from urllib.parse import urlsplit, urlunsplit
 
-import yaml, feedparser
+import yaml, httpx, feedparser
+from dateutil import parser as dtparse
+
+from workers.feed_xml import parse_feed_items  # lxml RSS/Atom reader shared with weekly_discover
 
 from google.oauth2.credentials import Credentials
 from googleapiclient.discovery import build
@@ -45,8 +51,12 @@ try:
 except Exception:
     OpenAI = None  # type: ignore
 
-# --- Audio merge (ffmpeg required; installed in workflow) ---
-from pydub import AudioSegment
+# HTTP/2 lets concurrent chat/TTS requests multiplex over one TLS connection (needs `h2`)
+try:
+    import h2  # noqa: F401
+    HTTP2 = True
+except Exception:
+    HTTP2 = False
 
 # --- Token counting (optional; graceful fallback) ---
 try:
@@ -62,6 +72,7 @@ REPORTS_DIR = ROOT / "reports" / "weekly"
 STATE_DIR = ROOT / "state"
 REPORTS_DIR.mkdir(parents=True, exist_ok=True)
 STATE_DIR.mkdir(parents=True, exist_ok=True)
+LAST_RUN_PATH = STATE_DIR / "last_weekly.json"
 
 # ------------------------ Config & window ------------------------
 
@@ -82,7 +93,8 @@ GOOGLE_SCOPES = [
     "https://www.googleapis.com/auth/documents",
 ]
 
-def get_google_services():
+@lru_cache(maxsize=1)
+def google_creds() -> Credentials:
     cid  = os.environ["GOOGLE_OAUTH_CLIENT_ID"]
     csec = os.environ["GOOGLE_OAUTH_CLIENT_SECRET"]
     rtok = os.environ["GOOGLE_OAUTH_REFRESH_TOKEN"]
@@ -96,69 +108,191 @@ def get_google_services():
         scopes=GOOGLE_SCOPES,
     )
     creds.refresh(Request())
-    drive = build("drive", "v3", credentials=creds)
-    docs  = build("docs",  "v1", credentials=creds)
+    return creds
+
+@lru_cache(maxsize=1)
+def get_google_services():
+    creds = google_creds()
+    # Discovery documents ship with google-api-python-client; never fetch them over the network
+    drive = build("drive", "v3", credentials=creds, static_discovery=True)
+    docs  = build("docs",  "v1", credentials=creds, static_discovery=True)
     return drive, docs
 
 # ------------------------ Feed ingest & scoring ------------------
 
-def fetch_feed(url: str) -> List[Dict[str, Any]]:
-    p = feedparser.parse(url)
-    out: List[Dict[str, Any]] = []
-    for e in p.entries:
-        title = (e.get("title") or "").strip()
+MAX_UNDATED_PER_FEED = 20  # undated entries kept per feed (they can't be window-checked)
+FEED_CACHE_PATH = STATE_DIR / "feed_cache.json"
+
+def load_feed_cache() -> Dict[str, Any]:
+    try:
+        return json.loads(FEED_CACHE_PATH.read_text(encoding="utf-8"))
+    except Exception:
+        return {}
+
+def save_feed_cache(cache: Dict[str, Any]) -> None:
+    FEED_CACHE_PATH.write_text(json.dumps(cache, ensure_ascii=False), encoding="utf-8")
+
+FEED_UA = "Mozilla/5.0 (compatible; EU-weekly-briefing/1.0)"
+
+@lru_cache(maxsize=1)
+def feed_http() -> httpx.Client:
+    """Pooled client for feed downloads (shared by the fetch threads)."""
+    return httpx.Client(
+        http2=HTTP2, follow_redirects=True, headers={"User-Agent": FEED_UA},
+        limits=httpx.Limits(max_keepalive_connections=16, max_connections=16),
+        timeout=httpx.Timeout(30.0, connect=10.0),
+    )
+
+def parse_feed_date(s: str | None) -> dt.datetime | None:
+    if not s: return None
+    s = s.strip()
+    try:
+        d = email.utils.parsedate_to_datetime(s)  # RSS pubDate (RFC 822)
+    except Exception:
+        try:
+            d = dt.datetime.fromisoformat(s.replace("Z", "+00:00"))  # Atom / dc:date (RFC 3339)
+        except Exception:
+            try:
+                d = dtparse.parse(s)  # looser dates ("20 Aug 2025", "Aug 20, 2025") like feedparser
+            except Exception:
+                return None
+    if d.tzinfo is None: d = d.replace(tzinfo=dt.timezone.utc)
+    return d.astimezone(dt.timezone.utc)
+
+def parse_feed_fallback(content: bytes) -> List[Dict[str, Any]]:
+    """feedparser for feeds lxml can't make sense of (odd dialects, broken markup)."""
+    entries: List[Dict[str, Any]] = []
+    for e in feedparser.parse(content).entries:
         link = (e.get("link") or "").strip()
-        summary = (e.get("summary") or e.get("description") or "").strip()
+        if not link:
+            continue
         published = None
-        for key in ("published_parsed", "updated_parsed"):
-            t = e.get(key)
-            if t:
-                try:
-                    published = dt.datetime(
-                        t.tm_year, t.tm_mon, t.tm_mday, t.tm_hour, t.tm_min, t.tm_sec,
-                        tzinfo=dt.timezone.utc
-                    ); break
-                except Exception:
-                    pass
-        out.append({"title": title, "link": link, "summary": summary, "published": published})
+        t = e.get("published_parsed") or e.get("updated_parsed")
+        if t:
+            try:
+                # feedparser normalises to UTC struct_time
+                published = dt.datetime.fromtimestamp(calendar.timegm(t), tz=dt.timezone.utc)
+            except Exception:
+                pass
+        title = (e.get("title") or "").strip()
+        summary = (e.get("summary") or e.get("description") or "").strip()
+        entries.append({"title": title, "link": link, "summary": summary, "published": published})
+    return entries
+
+def fetch_feed(url: str, start: dt.datetime, end: dt.datetime,
+               cache: Dict[str, Any] | None = None) -> List[Dict[str, Any]]:
+    """Fetch a feed, keeping only linked entries inside [start, end] (plus a few undated ones).
+
+    With `cache`, the request is a conditional GET (ETag / Last-Modified); on 304 the
+    entries stored from the previous run are reused instead of re-downloading.
+    """
+    prev = (cache or {}).get(url) or {}
+    headers = {}
+    if "entries" in prev:
+        if prev.get("etag"): headers["If-None-Match"] = prev["etag"]
+        if prev.get("modified"): headers["If-Modified-Since"] = prev["modified"]
+    r = feed_http().get(url, headers=headers)
+    if r.status_code == 304 and "entries" in prev:
+        entries = [
+            {"title": t, "link": l, "summary": s,
+             "published": dt.datetime.fromisoformat(pub) if pub else None}
+            for t, l, s, pub in prev["entries"]
+        ]
+    else:
+        r.raise_for_status()
+        try:
+            entries = parse_feed_items(r.content, parse_feed_date, base=str(r.url))
+        except Exception:
+            entries = []
+        if not entries:
+            entries = parse_feed_fallback(r.content)
+        etag, modified = r.headers.get("etag"), r.headers.get("last-modified")
+        if cache is not None and (etag or modified):
+            # Entries older than this window can never fall inside a later one
+            cache[url] = {
+                "etag": etag, "modified": modified,
+                "entries": [
+                    [e["title"], e["link"], e["summary"], e["published"].isoformat() if e["published"] else None]
+                    for e in entries if e["published"] is None or e["published"] >= start
+                ],
+            }
+    out: List[Dict[str, Any]] = []
+    undated = 0
+    for e in entries:
+        published = e["published"]
+        if published is None:
+            if undated >= MAX_UNDATED_PER_FEED:
+                continue
+            undated += 1
+        elif not (start <= published <= end):
+            continue
+        out.append(e)
     return out
 
-def within_week(entry: Dict[str, Any], start: dt.datetime, end: dt.datetime) -> bool:
-    pub = entry.get("published")
-    if pub is None: return True
-    if pub.tzinfo is None: pub = pub.replace(tzinfo=dt.timezone.utc)
-    return start <= pub <= end
+def safe_fetch(url: str, start: dt.datetime, end: dt.datetime,
+               cache: Dict[str, Any] | None = None) -> List[Dict[str, Any]]:
+    try:
+        return fetch_feed(url, start, end, cache)
+    except Exception as ex:
+        print(f"[warn] feed error: {url} -> {ex}")
+        return []
 
-def score_entry(entry: Dict[str, Any], keywords: List[str], recent_bonus_hours: int) -> int:
+def score_entry(entry: Dict[str, Any], kw_lowers: Tuple[str, ...], recent_bonus_hours: int,
+                now: dt.datetime) -> int:
     txt = (entry["title"] + " " + entry["summary"]).lower()
-    score = sum(1 for kw in keywords if kw.lower() in txt)
+    score = sum(1 for kw in kw_lowers if kw in txt)
     pub = entry.get("published")
     if pub is None:
         score -= 1
     else:
         if pub.tzinfo is None: pub = pub.replace(tzinfo=dt.timezone.utc)
-        now = dt.datetime.now(dt.timezone.utc)
         if (now - pub).total_seconds() / 3600.0 <= recent_bonus_hours:
             score += 1
     return score
 
-def dedupe(entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    seen = set(); out: List[Dict[str, Any]] = []
-    for e in entries:
-        k = (e["title"].strip().lower(), e["link"].strip().lower())
-        if k in seen: continue
-        seen.add(k); out.append(e)
-    return out
+TRACKING_PARAMS = ("utm_", "fbclid", "gclid", "mc_cid", "mc_eid")
+
+def canonical_link(link: str) -> str:
+    """Lower-cased link without fragment or tracking query params (utm_*, fbclid, ...)."""
+    link = link.strip().lower()
+    if "?" not in link and "#" not in link:
+        return link
+    parts = urlsplit(link)
+    query = "&".join(q for q in parts.query.split("&") if q and not q.startswith(TRACKING_PARAMS))
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, query, ""))
+
+def dedupe_key(e: Dict[str, Any]) -> int:
+    # 64-bit digest keeps the seen-dict small; collisions at this scale are negligible
+    raw = (e["title"].strip().lower() + "\0" + canonical_link(e["link"])).encode("utf-8")
+    return int.from_bytes(hashlib.blake2b(raw, digest_size=8).digest(), "little")
+
+def sort_key(x: Dict[str, Any]):
+    pub = x.get("published")
+    if pub is None: pub = dt.datetime(1970, 1, 1, tzinfo=dt.timezone.utc)
+    elif pub.tzinfo is None: pub = pub.replace(tzinfo=dt.timezone.utc)
+    return (x["_score"], pub)
 
 # ------------------------ OpenAI helpers -------------------------
 
+OPENAI_MAX_RETRIES = 4
+
+@lru_cache(maxsize=1)
 def openai_client() -> OpenAI:
+    """One client (and one warm connection pool) shared by every LLM/TTS call."""
     if OpenAI is None:
         raise RuntimeError("OpenAI package not available.")
     # Safety: some runners inject proxy envs that can trip certain SDK versions
     for k in ("HTTP_PROXY","HTTPS_PROXY","ALL_PROXY","http_proxy","https_proxy","all_proxy"):
         os.environ.pop(k, None)
-    return OpenAI(api_key=os.environ["OPENAI_API_KEY"])
+    http_client = httpx.Client(
+        http2=HTTP2,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+        timeout=httpx.Timeout(60.0, connect=10.0),
+    )
+    # The SDK retries 408/409/429/5xx and timeouts with jittered exponential backoff,
+    # honouring Retry-After; allow a few more attempts than its default of 2.
+    return OpenAI(api_key=os.environ["OPENAI_API_KEY"], http_client=http_client,
+                  max_retries=OPENAI_MAX_RETRIES)
 
 def pick_model() -> str:
     m = (os.environ.get("OPENAI_WEEKLY_MODEL") or os.environ.get("OPENAI_MODEL") or "").strip()
@@ -173,14 +307,90 @@ def call_llm(system: str, user: str, max_tokens: int, model_override: str | None
     client = openai_client()
     model = model_override or pick_model()
     print(f"[llm] using model: {model}")
-    r = client.chat.completions.create(
+    stream = client.chat.completions.create(
         model=model,
         temperature=0.2,
         messages=[{"role": "system", "content": system},
                   {"role": "user", "content": user}],
         max_tokens=max_tokens,
+        stream=True,
     )
-    return (r.choices[0].message.content or "").strip()
+    parts: List[str] = []
+    for chunk in stream:
+        if not chunk.choices:
+            continue
+        delta = chunk.choices[0].delta.content
+        if delta:
+            parts.append(delta)
+    return "".join(parts).strip()
+
+# Opt-in Batch API (half price, no per-request rate limiting); results can take minutes to hours
+USE_BATCH = (os.environ.get("OPENAI_USE_BATCH") or "").strip().lower() in ("1", "true", "yes")
+BATCH_WAIT_MIN = int(os.environ.get("OPENAI_BATCH_WAIT_MIN") or 60)
+BATCH_POLL_S = 30
+BATCH_STATE_PATH = STATE_DIR / "llm_batch.json"
+
+def call_llm_batch(jobs: Dict[str, Tuple[str, str, int]]) -> Dict[str, str] | None:
+    """Run {custom_id: (system, user, max_tokens)} through the Batch API.
+
+    The batch id is persisted under state/ so a re-run with the same prompts resumes
+    polling instead of paying twice. Returns None on failure or after BATCH_WAIT_MIN,
+    leaving the caller to fall back to call_llm.
+    """
+    client = openai_client()
+    model = pick_model()
+    lines = [json.dumps({
+        "custom_id": cid, "method": "POST", "url": "/v1/chat/completions",
+        "body": {"model": model, "temperature": 0.2, "max_tokens": max_tokens,
+                 "messages": [{"role": "system", "content": system},
+                              {"role": "user", "content": user}]},
+    }, ensure_ascii=False) for cid, (system, user, max_tokens) in jobs.items()]
+    payload = ("\n".join(lines) + "\n").encode("utf-8")
+    phash = hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+    try:
+        state = json.loads(BATCH_STATE_PATH.read_text(encoding="utf-8"))
+    except Exception:
+        state = {}
+    batch_id = state.get("batch_id") if state.get("prompt_hash") == phash else None
+    if batch_id:
+        print(f"[llm] resuming batch {batch_id}")
+    else:
+        f = client.files.create(file=("weekly_batch.jsonl", payload), purpose="batch")
+        batch_id = client.batches.create(input_file_id=f.id, endpoint="/v1/chat/completions",
+                                         completion_window="24h").id
+        BATCH_STATE_PATH.write_text(json.dumps({"batch_id": batch_id, "prompt_hash": phash}), encoding="utf-8")
+        print(f"[llm] submitted batch {batch_id} ({len(jobs)} requests, model {model})")
+
+    deadline = time.monotonic() + BATCH_WAIT_MIN * 60
+    while True:
+        b = client.batches.retrieve(batch_id)
+        if b.status == "completed" and b.output_file_id:
+            break
+        if b.status in ("completed", "failed", "expired", "cancelled", "cancelling"):
+            print(f"[llm] batch {batch_id} ended as {b.status}; falling back to direct calls")
+            BATCH_STATE_PATH.unlink(missing_ok=True)
+            return None
+        if time.monotonic() > deadline:
+            print(f"[llm] batch {batch_id} still {b.status} after {BATCH_WAIT_MIN} min; falling back to direct calls")
+            try: client.batches.cancel(batch_id)
+            except Exception: pass
+            BATCH_STATE_PATH.unlink(missing_ok=True)
+            return None
+        time.sleep(BATCH_POLL_S)
+
+    out: Dict[str, str] = {}
+    for line in client.files.content(b.output_file_id).text.splitlines():
+        if not line.strip(): continue
+        rec = json.loads(line)
+        resp = rec.get("response") or {}
+        if resp.get("status_code") == 200:
+            out[rec["custom_id"]] = resp["body"]["choices"][0]["message"]["content"].strip()
+    BATCH_STATE_PATH.unlink(missing_ok=True)
+    if set(out) != set(jobs):
+        print(f"[llm] batch {batch_id} missing results for {sorted(set(jobs) - set(out))}")
+        return None
+    return out
 
 # ------------------------ Chunked TTS + merge --------------------
 
@@ -189,10 +399,10 @@ def strip_references_for_audio(text: str) -> str:
     t = re.sub(r"\[\d+\]", "", t)
     return t
 
-def split_into_token_chunks(text: str, max_tokens: int = 1500) -> List[str]:
+def pack_paragraphs(paras: List[str], max_tokens: int, measure) -> List[str]:
     parts, buf, cur = [], [], 0
-    for para in text.split("\n\n"):
-        t = count_tokens(para)
+    for para in paras:
+        t = measure(para)
         if cur + t > max_tokens and buf:
             parts.append("\n\n".join(buf).strip()); buf, cur = [para], t
         else:
@@ -200,114 +410,178 @@ def split_into_token_chunks(text: str, max_tokens: int = 1500) -> List[str]:
     if buf: parts.append("\n\n".join(buf).strip())
     return parts
 
+def split_into_token_chunks(text: str, max_tokens: int = 1500) -> List[str]:
+    """Pack paragraphs by a ~4 chars/token estimate; only chunks near the limit are tokenized."""
+    out: List[str] = []
+    for chunk in pack_paragraphs(text.split("\n\n"), max_tokens, lambda p: max(1, len(p) >> 2)):
+        if (len(chunk) >> 2) > max_tokens - 200 and count_tokens(chunk) > max_tokens:
+            out.extend(pack_paragraphs(chunk.split("\n\n"), max_tokens, count_tokens))
+        else:
+            out.append(chunk)
+    return out
+
+TTS_WORKERS = 4
+TTS_MAX_RETRIES = 8
+AUDIO_COPY_BUF = 1 << 20
+
 def synthesize_tts_chunked(full_text: str, out_mp3: pathlib.Path, tts_model: str, tts_voice: str) -> pathlib.Path:
     """
     Split text to respect model input limit, synthesize each chunk via the
-    streaming TTS API (no 'format' kwarg), then merge to a single MP3.
+    streaming TTS API (no 'format' kwarg), then concatenate into a single MP3.
     """
-    client = openai_client()
+    # TTS is rate-limited more tightly than chat: retry 429s longer (SDK backoff honours Retry-After)
+    client = openai_client().with_options(max_retries=TTS_MAX_RETRIES)
     cleaned = strip_references_for_audio(full_text)
     chunks = split_into_token_chunks(cleaned, max_tokens=1500)
 
-    tmp_dir = ROOT / "tmp_audio"; tmp_dir.mkdir(exist_ok=True)
-    part_files: List[pathlib.Path] = []
-
-    for i, chunk in enumerate(chunks, 1):
-        part_path = tmp_dir / f"part_{i:02d}.mp3"
-        print(f"[audio] generating part {i}/{len(chunks)} → {part_path}")
-        # Streaming API – write straight to file (no 'format' kwarg)
+    def synth_one(i: int, chunk: str) -> io.BytesIO:
+        print(f"[audio] generating part {i}/{len(chunks)}")
+        # Streaming API – parts stay in memory (a few MB each); no 'format' kwarg
+        buf = io.BytesIO()
         with client.audio.speech.with_streaming_response.create(
             model=tts_model,
             voice=tts_voice,
             input=chunk,
         ) as resp:
-            resp.stream_to_file(str(part_path))
-        part_files.append(part_path)
-
-    merged = None
-    for p in part_files:
-        seg = AudioSegment.from_file(p, format="mp3")
-        merged = seg if merged is None else (merged + seg)
-    merged.export(out_mp3, format="mp3")
-    print(f"[audio] merged {len(part_files)} parts → {out_mp3}")
+            for block in resp.iter_bytes(chunk_size=AUDIO_COPY_BUF):
+                buf.write(block)
+        buf.seek(0)
+        return buf
+
+    # Parts are independent; map() returns them in chunk order
+    with ThreadPoolExecutor(max_workers=TTS_WORKERS) as pool:
+        parts = list(pool.map(synth_one, range(1, len(chunks) + 1), chunks))
+
+    # Every part comes from the same model/voice/MP3 profile and MP3 frames decode
+    # independently, so plain byte concatenation plays back as one track.
+    with open(out_mp3, "wb", buffering=AUDIO_COPY_BUF) as dst:
+        for buf in parts:
+            shutil.copyfileobj(buf, dst, AUDIO_COPY_BUF)
+    print(f"[audio] merged {len(parts)} parts → {out_mp3}")
     return out_mp3
 
 # ------------------------ Drive/Docs helpers --------------------
 
+UPLOAD_CHUNK = 8 * 1024 * 1024  # resumable upload chunk (multiple of 256 KiB)
+# googleapiclient retries 429/5xx and connection errors with randomised exponential backoff
+GOOGLE_RETRIES = 4
+
 def drive_upload_binary(drive, path: pathlib.Path, name: str, mime: str, folder_id: str | None):
     body = {"name": name}
     if folder_id: body["parents"] = [folder_id]
-    media = MediaFileUpload(str(path), mimetype=mime, resumable=False)
-    f = drive.files().create(body=body, media_body=media, fields="id,webViewLink,webContentLink").execute()
+    media = MediaFileUpload(str(path), mimetype=mime, resumable=True, chunksize=UPLOAD_CHUNK)
+    request = drive.files().create(body=body, media_body=media, fields="id,webViewLink,webContentLink")
+    f = None
+    while f is None:
+        status, f = request.next_chunk(num_retries=GOOGLE_RETRIES)
+        if status:
+            print(f"[drive] upload {name}: {int(status.progress() * 100)}%")
     return f["id"], f.get("webViewLink") or f.get("webContentLink") or ""
 
+DRIVE_BATCH_MAX = 100  # Drive API limit on calls per batch request
+
+def drive_share(drive, file_ids: List[str], share_with: List[str]) -> None:
+    """Grant reader access on every file to every address, up to 100 grants per HTTP batch."""
+    def on_done(request_id, response, exception):
+        if exception is not None:
+            print(f"[share] permission {request_id} failed: {exception}")
+
+    # Deduped: batch request ids must be unique, and a repeated address in
+    # GOOGLE_DOCS_SHARE_WITH would otherwise fail the whole batch
+    grants = list(dict.fromkeys((addr, file_id) for addr in share_with for file_id in file_ids))
+    for i in range(0, len(grants), DRIVE_BATCH_MAX):
+        batch = drive.new_batch_http_request(callback=on_done)
+        for addr, file_id in grants[i:i + DRIVE_BATCH_MAX]:
+            batch.add(
+                drive.permissions().create(
+                    fileId=file_id,
+                    body={"type": "user", "role": "reader", "emailAddress": addr},
+                    sendNotificationEmail=False,
+                ),
+                request_id=f"{addr}:{file_id}",
+            )
+        batch.execute()
+
 def doc_create(docs, title: str) -> str:
-    d = docs.documents().create(body={"title": title}).execute()
+    d = docs.documents().create(body={"title": title}).execute(num_retries=GOOGLE_RETRIES)
     return d["documentId"]
 
 def move_doc_to_folder(drive, doc_id: str, folder_id: str):
     # Hard move: remove previous parents so it only lives in the target folder
-    meta = drive.files().get(fileId=doc_id, fields="parents").execute()
+    meta = drive.files().get(fileId=doc_id, fields="parents").execute(num_retries=GOOGLE_RETRIES)
     prev = ",".join(meta.get("parents", []))
     drive.files().update(
         fileId=doc_id,
         addParents=folder_id,
         removeParents=prev,
         fields="id, parents"
-    ).execute()
+    ).execute(num_retries=GOOGLE_RETRIES)
 
 def doc_batch_update(docs, doc_id: str, requests: List[Dict[str, Any]]):
-    docs.documents().batchUpdate(documentId=doc_id, body={"requests": requests}).execute()
+    docs.documents().batchUpdate(documentId=doc_id, body={"requests": requests}).execute(num_retries=GOOGLE_RETRIES)
 
-def _insert_chunked(reqs: List[Dict[str, Any]], cursor_ref: List[int], text: str, chunk: int = 15000):
-    i = 0
-    while i < len(text):
-        piece = text[i:i+chunk]
-        reqs.append({"insertText": {"location": {"index": cursor_ref[0]}, "text": piece}})
-        cursor_ref[0] += len(piece); i += chunk
+# insertText rejects control and private-use characters (LLM output occasionally has both)
+DOC_STRIP = dict.fromkeys([*range(0x00, 0x09), *range(0x0B, 0x20), 0x7F, *range(0xE000, 0xF900)])
+
+def utf16_len(s: str) -> int:
+    """Docs indices count UTF-16 code units: characters outside the BMP (emoji) take two."""
+    return len(s) if s.isascii() else len(s.encode("utf-16-le")) // 2
 
 def doc_insert_text_requests(title: str, listen_url: str | None,
                              briefing: str, analysis: str,
                              references: List[str]) -> List[Dict[str, Any]]:
-    reqs: List[Dict[str, Any]] = []
-    cursor = [1]
-
-    def style(start: int, end: int, named: str) -> None:
-        reqs.append({
-            "updateParagraphStyle": {
-                "range": {"startIndex": start, "endIndex": end},
-                "paragraphStyle": {"namedStyleType": named},
-                "fields": "namedStyleType",
-            }
-        })
+    """
+    Build the Doc body as ONE insertText at index 1, followed by the paragraph
+    styles (and References bullets) whose ranges are known from string lengths.
+    """
+    parts: List[str] = []
+    headings: List[Tuple[int, int, str]] = []
+    cursor = 1
+
+    def add(text: str, named: str | None = None) -> Tuple[int, int]:
+        nonlocal cursor
+        text = text.translate(DOC_STRIP)
+        start = cursor
+        parts.append(text); cursor += utf16_len(text)
+        if named: headings.append((start, cursor, named))
+        return start, cursor
 
     # Title
-    start = cursor[0]; _insert_chunked(reqs, cursor, title + "\n"); style(start, cursor[0], "HEADING_1")
-    _insert_chunked(reqs, cursor, "\n")
+    add(title + "\n", "HEADING_1")
+    add("\n")
 
     # Listen link (if any)
     if listen_url:
-        start = cursor[0]; _insert_chunked(reqs, cursor, "Listen to this briefing (MP3)\n"); style(start, cursor[0], "HEADING_2")
-        _insert_chunked(reqs, cursor, listen_url + "\n\n")
+        add("Listen to this briefing (MP3)\n", "HEADING_2")
+        add(listen_url + "\n\n")
 
     # Briefing
-    start = cursor[0]; _insert_chunked(reqs, cursor, "Weekly Economic & Policy Overview\n"); style(start, cursor[0], "HEADING_2")
-    _insert_chunked(reqs, cursor, briefing.strip() + "\n\n")
+    add("Weekly Economic & Policy Overview\n", "HEADING_2")
+    add(briefing.strip() + "\n\n")
 
     # Analysis
-    start = cursor[0]; _insert_chunked(reqs, cursor, "Weekly EU Policy Analysis\n"); style(start, cursor[0], "HEADING_2")
-    _insert_chunked(reqs, cursor, analysis.strip() + "\n\n")
+    add("Weekly EU Policy Analysis\n", "HEADING_2")
+    add(analysis.strip() + "\n\n")
 
     # References section
+    refs_range = None
     if references:
-        start = cursor[0]; _insert_chunked(reqs, cursor, "References\n"); style(start, cursor[0], "HEADING_2")
-        refs_start = cursor[0]
-        _insert_chunked(reqs, cursor, "\n".join(references) + "\n")
-        refs_end = cursor[0]
+        add("References\n", "HEADING_2")
+        refs_range = add("\n".join(references) + "\n")
+
+    reqs: List[Dict[str, Any]] = [{"insertText": {"location": {"index": 1}, "text": "".join(parts)}}]
+    reqs += [{
+        "updateParagraphStyle": {
+            "range": {"startIndex": start, "endIndex": end},
+            "paragraphStyle": {"namedStyleType": named},
+            "fields": "namedStyleType",
+        }
+    } for start, end, named in headings]
+    if refs_range:
         # Use a valid numbered preset; only create bullets when content exists
         reqs.append({
             "createParagraphBullets": {
-                "range": {"startIndex": refs_start, "endIndex": refs_end},
+                "range": {"startIndex": refs_range[0], "endIndex": refs_range[1]},
                 "bulletPreset": "NUMBERED_DECIMAL_ALPHA_ROMAN"
             }
         })
@@ -328,6 +602,26 @@ def send_email_notice(subject: str, body: str) -> None:
 
 # ------------------------ Prompting -----------------------------
 
+PROMPT_TOKEN_BUDGET = 6000  # cap on corpus tokens sent with the briefing prompt
+SENTENCE_SPLIT = re.compile(r"(?<=[.!?])\s+")
+
+def corpus_line(e: Dict[str, Any]) -> str:
+    # First two sentences of the feed summary are enough context per item
+    snippet = " ".join(SENTENCE_SPLIT.split(e["summary"], maxsplit=2)[:2])
+    return f"- {e['title']} :: {snippet} :: {e['link']}"
+
+def fit_token_budget(entries: List[Dict[str, Any]], budget: int = PROMPT_TOKEN_BUDGET) -> List[Dict[str, Any]]:
+    """Keep entries (already in score order) while their corpus lines fit the token budget."""
+    kept: List[Dict[str, Any]] = []
+    used = 0
+    for e in entries:
+        t = count_tokens(corpus_line(e))
+        if used + t > budget and kept:
+            break
+        kept.append(e); used += t
+    print(f"[prompt] included {len(kept)}/{len(entries)} items at {used / 1000:.1f}k tokens")
+    return kept
+
 def build_prompts(selected: List[Dict[str, Any]], window: Tuple[dt.datetime, dt.datetime]):
     start, end = window
     start_iso, end_iso = start.date().isoformat(), end.date().isoformat()
@@ -335,7 +629,7 @@ def build_prompts(selected: List[Dict[str, Any]], window: Tuple[dt.datetime, dt.
     # References used both in body [n] citations and the final References list
     numbered = [f"[{i}] {e['title']} — {e['link']}" for i, e in enumerate(selected, 1)]
     # Corpus for LLM
-    corpus = "\n".join(f"- {e['title']} :: {e['summary']} :: {e['link']}" for e in selected)
+    corpus = "\n".join(corpus_line(e) for e in selected)
 
     system = (
         "You are a senior EU policy analyst. Write clear professional prose in plain paragraphs "
@@ -350,7 +644,9 @@ def build_prompts(selected: List[Dict[str, Any]], window: Tuple[dt.datetime, dt.
         "Open with 1–2 paragraphs stating the week's top-line narrative. Then synthesise monetary policy, "
         "financial markets, banking/insurance, digital/AI, ESG, EU institutions, and defence. "
         "Insert short sub-headings where helpful (plain text, no markdown). "
-        "Weave items into the narrative with citations like [3], [7] using this numbered list:\n"
+        "Weave items into the narrative with citations like [3], [7]. If the draft is still under 1,800 words, "
+        "keep writing in the same answer — deepen mechanisms, EU institutional context and scenarios — "
+        "until it is past the minimum. Use this numbered list:\n"
         + "\n".join(numbered)
     )
 
@@ -363,6 +659,8 @@ def build_prompts(selected: List[Dict[str, Any]], window: Tuple[dt.datetime, dt.
 
     return (system, user_brief), (system, user_analysis), numbered
 
+BRIEF_MAX_TOKENS = 6000  # ~4,500 words of headroom so the 1,800-word minimum lands in one call
+
 def enforce_min_words(text: str, min_words: int = 1800) -> str:
     words = len(text.split())
     if words >= min_words: return text
@@ -382,6 +680,16 @@ def fmt_date(d: dt.datetime | None) -> str:
     if d.tzinfo is None: d = d.replace(tzinfo=dt.timezone.utc)
     return d.date().isoformat()
 
+def content_hash(entries: List[Dict[str, Any]]) -> str:
+    links = sorted(e["link"] for e in entries)
+    return hashlib.blake2b("\n".join(links).encode("utf-8"), digest_size=16).hexdigest()
+
+def load_last_run() -> Dict[str, Any]:
+    try:
+        return json.loads(LAST_RUN_PATH.read_text(encoding="utf-8"))
+    except Exception:
+        return {}
+
 def slug(s: str) -> str:
     s = re.sub(r"[^\w\-]+", "_", s, flags=re.UNICODE)
     return re.sub(r"_+", "_", s).strip("_").lower()
@@ -390,38 +698,57 @@ def main() -> int:
     cfg = load_config()
     feeds: List[str] = cfg.get("feeds", [])
     keywords: List[str] = cfg.get("keywords", [])
+    kw_lowers = tuple(k.lower() for k in keywords)
     recent_bonus = int(cfg.get("recent_hours", 72))
     cap = int(cfg.get("caps", {}).get("max_total", 50))
 
     wstart, wend = last_7_days_utc()
 
-    # Fetch and filter
-    all_entries: List[Dict[str, Any]] = []
-    for u in feeds:
-        try:
-            all_entries.extend(fetch_feed(u))
-        except Exception as ex:
-            print(f"[warn] feed error: {u} -> {ex}")
-
-    week_entries = [e for e in all_entries if within_week(e, wstart, wend)]
-    week_entries = dedupe(week_entries)
-    for e in week_entries:
-        e["_score"] = score_entry(e, keywords, recent_bonus)
+    # Fetch, dedupe and score in one pass (fetch_feed already drops out-of-window entries)
+    # Feeds are fetched concurrently; map() keeps feed order so dedupe stays deterministic
+    feed_cache = load_feed_cache()
+    now = dt.datetime.now(dt.timezone.utc)
+    by_key: Dict[int, Dict[str, Any]] = {}
+    with ThreadPoolExecutor(max_workers=max(1, min(16, len(feeds)))) as pool:
+        for entries in pool.map(lambda u: safe_fetch(u, wstart, wend, feed_cache), feeds):
+            for e in entries:
+                k = dedupe_key(e)
+                if k in by_key: continue
+                e["_score"] = score_entry(e, kw_lowers, recent_bonus, now)
+                by_key[k] = e
+    try:
+        save_feed_cache({u: feed_cache[u] for u in feeds if u in feed_cache})
+    except Exception as ex:
+        print(f"[warn] could not save feed cache: {ex}")
 
-    def sort_key(x: Dict[str, Any]):
-        pub = x.get("published")
-        if pub is None: pub = dt.datetime(1970, 1, 1, tzinfo=dt.timezone.utc)
-        elif pub.tzinfo is None: pub = pub.replace(tzinfo=dt.timezone.utc)
-        return (x["_score"], pub)
+    # Top-`cap` by (score, recency) without sorting the whole week
+    selected = fit_token_budget(heapq.nlargest(cap, by_key.values(), key=sort_key))
 
-    week_entries.sort(key=sort_key, reverse=True)
-    selected = week_entries[:cap]
+    # Same set of items as the last run -> nothing new to write up (set WEEKLY_FORCE=1 to override)
+    chash = content_hash(selected)
+    last = load_last_run()
+    if last.get("content_hash") == chash and last.get("doc_id") and not os.environ.get("WEEKLY_FORCE"):
+        print(f"[skip] no new content since last run: https://docs.google.com/document/d/{last['doc_id']}/edit")
+        if last.get("listen_url"): print(f"[skip] MP3 link: {last['listen_url']}")
+        return 0
 
     # Build prompts and generate text
     (sys_b, user_b), (sys_a, user_a), numbered_refs = build_prompts(selected, (wstart, wend))
-    briefing = call_llm(sys_b, user_b, max_tokens=5000)
-    briefing = enforce_min_words(briefing, 1800)
-    analysis = call_llm(sys_a, user_a, max_tokens=2000)
+    results = None
+    if USE_BATCH:
+        try:
+            results = call_llm_batch({"brief": (sys_b, user_b, BRIEF_MAX_TOKENS), "analysis": (sys_a, user_a, 2000)})
+        except Exception as ex:
+            print(f"[llm] batch submission failed: {ex}")
+    if results:
+        briefing, analysis = results["brief"], results["analysis"]
+    else:
+        # The two prompts are independent: wall time is the slower call, not the sum
+        with ThreadPoolExecutor(max_workers=2) as llm_pool:
+            brief_job = llm_pool.submit(call_llm, sys_b, user_b, BRIEF_MAX_TOKENS)
+            analysis_job = llm_pool.submit(call_llm, sys_a, user_a, 2000)
+            briefing, analysis = brief_job.result(), analysis_job.result()
+    briefing = enforce_min_words(briefing, 1800)  # last resort; the prompt asks for the length up front
 
     # Prepare title/filenames
     start_label = (wend - dt.timedelta(days=7)).date().isoformat()
@@ -430,19 +757,17 @@ def main() -> int:
     title = f"Weekly — EU Finance & Defence — {start_label} to {end_label} (W{week_num:02d})"
     base_slug = slug(f"{end_label}-weekly")
 
-    # Optional audio (chunked)
+    # Optional audio (chunked) — synthesised in the background while the Doc is created
     listen_url = None
     mp3_id = None
     mp3_path = REPORTS_DIR / f"{base_slug}.mp3"
-    try:
-        print("[audio] generating MP3 (chunked)…")
-        tts_model = (os.environ.get("OPENAI_TTS_MODEL") or "gpt-4o-mini-tts").strip()
-        tts_voice = (os.environ.get("OPENAI_TTS_VOICE") or "alloy").strip()
-        tts_text = f"{title}. Weekly Economic & Policy Overview. {briefing}\n\nWeekly EU Policy Analysis. {analysis}"
-        synthesize_tts_chunked(tts_text, mp3_path, tts_model, tts_voice)
-    except Exception as ex:
-        print(f"[audio] skipped: {ex}")
-        mp3_path = None
+    print("[audio] generating MP3 (chunked)…")
+    tts_model = (os.environ.get("OPENAI_TTS_MODEL") or "gpt-4o-mini-tts").strip()
+    tts_voice = (os.environ.get("OPENAI_TTS_VOICE") or "alloy").strip()
+    tts_text = f"{title}. Weekly Economic & Policy Overview. {briefing}\n\nWeekly EU Policy Analysis. {analysis}"
+    audio_pool = ThreadPoolExecutor(max_workers=1)
+    audio_job = audio_pool.submit(synthesize_tts_chunked, tts_text, mp3_path, tts_model, tts_voice)
+    audio_pool.shutdown(wait=False)
 
     # Google Docs + sharing + move to folder
     drive, docs = get_google_services()
@@ -456,6 +781,13 @@ def main() -> int:
         except Exception as ex:
             print(f"[warn] could not move doc to folder {folder_id}: {ex}")
 
+    # Audio is only needed from here on (upload + listen link)
+    try:
+        audio_job.result()
+    except Exception as ex:
+        print(f"[audio] skipped: {ex}")
+        mp3_path = None
+
     # Upload MP3 first (if any) so we can insert the link at top of Doc
     if mp3_path and mp3_path.exists():
         try:
@@ -475,30 +807,22 @@ def main() -> int:
     reqs = doc_insert_text_requests(title, listen_url, briefing, analysis, ref_lines)
     doc_batch_update(docs, doc_id, reqs)
 
-    # Share Doc/MP3 (if requested)
-    if share_with:
-        for addr in share_with:
-            for file_id in [doc_id] + ([mp3_id] if (mp3_id and listen_url) else []):
-                try:
-                    drive.permissions().create(
-                        fileId=file_id,
-                        body={"type": "user", "role": "reader", "emailAddress": addr},
-                        sendNotificationEmail=False,
-                    ).execute()
-                except Exception as ex:
-                    print(f"[share] permission for {addr} failed on {file_id}: {ex}")
-
-    # Local mirrors
+    # Local mirror (one write, on a worker thread) alongside the Doc/MP3 share grants
     txt_path = REPORTS_DIR / f"{base_slug}.txt"
-    with txt_path.open("w", encoding="utf-8") as f:
-        f.write(title + "\n\n")
-        f.write("Weekly Economic & Policy Overview\n")
-        f.write(briefing.strip() + "\n\n")
-        f.write("Weekly EU Policy Analysis\n")
-        f.write(analysis.strip() + "\n\n")
-        f.write("References\n")
-        for i, line in enumerate(ref_lines, 1):
-            f.write(f"{i}. {line}\n")
+    mirror = (
+        f"{title}\n\n"
+        f"Weekly Economic & Policy Overview\n{briefing.strip()}\n\n"
+        f"Weekly EU Policy Analysis\n{analysis.strip()}\n\n"
+        "References\n" + "".join(f"{i}. {line}\n" for i, line in enumerate(ref_lines, 1))
+    )
+    with ThreadPoolExecutor(max_workers=1) as io_pool:
+        mirror_job = io_pool.submit(txt_path.write_text, mirror, encoding="utf-8")
+        if share_with:
+            try:
+                drive_share(drive, [doc_id] + ([mp3_id] if (mp3_id and listen_url) else []), share_with)
+            except Exception as ex:
+                print(f"[share] batch failed: {ex}")
+        mirror_job.result()
 
     # Email success notice (if Gmail creds provided)
     doc_url = f"https://docs.google.com/document/d/{doc_id}/edit"
@@ -510,6 +834,11 @@ def main() -> int:
     ]
     send_email_notice(subject=title, body="\n".join(body_lines))
 
+    LAST_RUN_PATH.write_text(json.dumps({
+        "content_hash": chash, "doc_id": doc_id, "listen_url": listen_url,
+        "created": dt.datetime.now(dt.timezone.utc).isoformat(),
+    }, indent=2), encoding="utf-8")
+
     print(f"[done] Google Doc: {doc_url}")
     if listen_url: print(f"[done] MP3 link: {listen_url}")
     print(f"[done] Wrote mirrors in {REPORTS_DIR}")
@@ -6,19 +6,23 @@
 # - docs/digests/latest.json (pointer for website)
 
 import os, json, glob, argparse
+import orjson
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta, timezone
+from functools import partial
+from itertools import chain
 from dateutil import parser as dtparse
 
 def load_lines(paths):
     for p in paths:
         if not os.path.exists(p): 
             continue
-        with open(p, "r", encoding="utf-8") as f:
+        with open(p, "rb") as f:
             for line in f:
                 line=line.strip()
                 if line:
                     try:
-                        yield json.loads(line)
+                        yield orjson.loads(line)
                     except Exception:
                         continue
 
@@ -31,27 +35,14 @@ def parse_dt(s):
     except Exception:
         return None
 
-def ensure_dirs():
-    os.makedirs("reports/daily", exist_ok=True)
-    os.makedirs("docs/digests", exist_ok=True)
-
-def main():
-    ap = argparse.ArgumentParser()
-    ap.add_argument("--hours", type=int, default=24)
-    args = ap.parse_args()
-
-    ensure_dirs()
-    now = datetime.now(timezone.utc)
-    start = now - timedelta(hours=args.hours)
-
-    # Collect docs from all ndjson files
-    ndjson_files = sorted(glob.glob("outputs/docs/*.ndjson"))
+def collect_items(path, start, end):
+    # Runs in a worker process: parse one shard and return only in-window digest items
     items = []
-    for rec in load_lines(ndjson_files):
+    for rec in load_lines([path]):
         pd = parse_dt(rec.get("published_date") or rec.get("fetch_time"))
         if not pd: 
             continue
-        if start <= pd <= now:
+        if start <= pd <= end:
             items.append({
                 "title": rec.get("title"),
                 "url": rec.get("canonical_url") or rec.get("url"),
@@ -63,6 +54,29 @@ def main():
                 "tech_area": rec.get("tech_area") or [],
                 "summary_150w": rec.get("summary_150w")
             })
+    return items
+
+def ensure_dirs():
+    os.makedirs("reports/daily", exist_ok=True)
+    os.makedirs("docs/digests", exist_ok=True)
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--hours", type=int, default=24)
+    args = ap.parse_args()
+
+    ensure_dirs()
+    now = datetime.now(timezone.utc)
+    start = now - timedelta(hours=args.hours)
+
+    # Collect docs from all ndjson files (one process per shard)
+    ndjson_files = sorted(glob.glob("outputs/docs/*.ndjson"))
+    collect = partial(collect_items, start=start, end=now)
+    if len(ndjson_files) > 1:
+        with ProcessPoolExecutor(max_workers=min(len(ndjson_files), os.cpu_count() or 1)) as ex:
+            items = list(chain.from_iterable(ex.map(collect, ndjson_files)))
+    else:
+        items = list(chain.from_iterable(map(collect, ndjson_files)))
 
     # sort newest first
     items.sort(key=lambda x: x.get("published_date") or "", reverse=True)
@@ -81,27 +95,27 @@ def main():
     }
 
     # JSON outputs
-    with open(out_json_path, "w", encoding="utf-8") as jf:
-        json.dump(payload, jf, ensure_ascii=False, indent=2)
-    with open(out_json_latest, "w", encoding="utf-8") as jf:
-        json.dump(payload, jf, ensure_ascii=False)
+    with open(out_json_path, "wb") as jf:
+        jf.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+    with open(out_json_latest, "wb") as jf:
+        jf.write(orjson.dumps(payload))
 
     # Markdown (simple)
+    md = [f"# Daily Digest — {date_str}\n\n", f"_Items in last {args.hours}h: {len(items)}_\n\n"]
+    for i, it in enumerate(items, 1):
+        progs = ", ".join(it.get("programme") or [])
+        inst = ", ".join(it.get("finance_instrument") or [])
+        tech = ", ".join(it.get("tech_area") or [])
+        md.append(f"**{i}. {it['title']}**  \n")
+        md.append(f"Bron: `{it.get('source_id')}` · Datum: {it.get('published_date')}  \n")
+        if progs: md.append(f"Programma: {progs}  \n")
+        if inst:  md.append(f"Instrument: {inst}  \n")
+        if tech:  md.append(f"Tech: {tech}  \n")
+        if it.get("summary_150w"):
+            md.append(f"{it['summary_150w']}\n")
+        md.append(f"[Link]({it['url']})\n\n")
     with open(out_md_path, "w", encoding="utf-8") as mf:
-        mf.write(f"# Daily Digest — {date_str}\n\n")
-        mf.write(f"_Items in last {args.hours}h: {len(items)}_\n\n")
-        for i, it in enumerate(items, 1):
-            progs = ", ".join(it.get("programme") or [])
-            inst = ", ".join(it.get("finance_instrument") or [])
-            tech = ", ".join(it.get("tech_area") or [])
-            mf.write(f"**{i}. {it['title']}**  \n")
-            mf.write(f"Bron: `{it.get('source_id')}` · Datum: {it.get('published_date')}  \n")
-            if progs: mf.write(f"Programma: {progs}  \n")
-            if inst:  mf.write(f"Instrument: {inst}  \n")
-            if tech:  mf.write(f"Tech: {tech}  \n")
-            if it.get("summary_150w"):
-                mf.write(f"{it['summary_150w']}\n")
-            mf.write(f"[Link]({it['url']})\n\n")
+        mf.write("".join(md))
 
     print(json.dumps({
         "status": "ok",
@@ -3,8 +3,15 @@
 
 import os, json, glob
 from datetime import datetime
+from latest_manifest import latest_from_manifest
 
-def latest(path_glob):
+
+def latest(path_glob, key=None):
+    # Producers record their newest output in the manifest; glob + mtime is the backfill fallback
+    if key:
+        p = latest_from_manifest(key)
+        if p:
+            return p
     files = sorted(glob.glob(path_glob), key=lambda p: os.path.getmtime(p), reverse=True)
     return files[0] if files else None
 
@@ -15,7 +22,7 @@ def main():
     ensure_dirs()
 
     # 1) timeline
-    tl_file = latest("outputs/timelines/*.json")
+    tl_file = latest("outputs/timelines/*.json", key="timeline")
     if tl_file:
         with open(tl_file, "r", encoding="utf-8") as f:
             tl = json.load(f)
@@ -23,7 +30,7 @@ def main():
             json.dump(tl, out, ensure_ascii=False)
 
     # 2) aggregates over most recent ndjson
-    ndjson_file = latest("outputs/docs/*.ndjson")
+    ndjson_file = latest("outputs/docs/*.ndjson", key="ndjson")
     agg = {"schema":"site_aggregate.v1","generated_at":datetime.utcnow().isoformat()+"Z","by_source":{}, "total":0}
     if ndjson_file:
         by_source = {}
@@ -3,7 +3,13 @@
 # Safe: reads outputs/docs/*.ndjson, writes outputs/timelines/YYYY-WW.json
 
 import argparse, os, sys, json, glob, re
+import orjson
+from latest_manifest import update_latest_manifest
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone, timedelta
+from functools import partial
+from itertools import chain
+from operator import itemgetter
 
 def parse_args():
     ap = argparse.ArgumentParser()
@@ -34,17 +40,50 @@ def iso_week_path(prefix="outputs/timelines"):
 
 def load_ndjson(path):
     items = []
-    with open(path, "r", encoding="utf-8") as f:
+    with open(path, "rb") as f:
         for line in f:
             line = line.strip()
             if not line:
                 continue
             try:
-                items.append(json.loads(line))
+                items.append(orjson.loads(line))
             except Exception:
                 continue
     return items
 
+def to_event(d, rec):
+    title = rec.get("title") or "(untitled)"
+    summary = rec.get("summary_150w") or ""
+    amounts = []
+    for mv in (rec.get("monetary_values") or []):
+        amt = mv.get("amount")
+        cur = mv.get("currency")
+        if isinstance(amt, (int, float)) and cur:
+            amounts.append({"amount": amt, "currency": cur})
+    return {
+        "date": d.isoformat(),
+        "title": title,
+        "url": rec.get("canonical_url") or rec.get("url"),
+        "doc_type": rec.get("doc_type") or "Blog/News",
+        "programme": rec.get("programme") or [],
+        "tech_area": rec.get("tech_area") or [],
+        "stage": rec.get("stage") or "NA",
+        "short": short_text(summary or title, max_words=40),
+        "amounts": amounts
+    }
+
+def load_window(path, start_dt, end_dt):
+    # Runs in a worker process: parse one shard and map in-window document.v2 records
+    # straight to events, so only the slim event dicts are pickled back to the parent.
+    out = []
+    for rec in load_ndjson(path):
+        if rec.get("schema") != "document.v2":
+            continue
+        d = parse_iso(rec.get("published_date") or "")
+        if d and start_dt <= d < end_dt:
+            out.append(to_event(d, rec))
+    return out
+
 def main():
     args = parse_args()
     # compute window
@@ -53,52 +92,17 @@ def main():
     end_dt = datetime.now(timezone.utc)
     start_dt = end_dt - timedelta(days=days)
 
-    # gather documents
-    docs = []
-    for fp in glob.glob("outputs/docs/*.ndjson"):
-        docs.extend(load_ndjson(fp))
-
-    # filter + map to events
-    events = []
-    for rec in docs:
-        if rec.get("schema") != "document.v2":
-            continue
-        d = parse_iso(rec.get("published_date") or "")
-        if not d:
-            continue
-        if not (start_dt <= d < end_dt):
-            continue
-
-        title = rec.get("title") or "(untitled)"
-        url = rec.get("canonical_url") or rec.get("url")
-        doc_type = rec.get("doc_type") or "Blog/News"
-        programme = rec.get("programme") or []
-        tech = rec.get("tech_area") or []
-        stage = rec.get("stage") or "NA"
-        summary = rec.get("summary_150w") or ""
-        short = short_text(summary or title, max_words=40)
-
-        amounts = []
-        for mv in (rec.get("monetary_values") or []):
-            amt = mv.get("amount")
-            cur = mv.get("currency")
-            if isinstance(amt, (int, float)) and cur:
-                amounts.append({"amount": amt, "currency": cur})
-
-        events.append({
-            "date": d.isoformat(),
-            "title": title,
-            "url": url,
-            "doc_type": doc_type,
-            "programme": programme,
-            "tech_area": tech,
-            "stage": stage,
-            "short": short,
-            "amounts": amounts
-        })
+    # gather + filter + map to events (one process per shard)
+    files = sorted(glob.glob("outputs/docs/*.ndjson"))
+    load = partial(load_window, start_dt=start_dt, end_dt=end_dt)
+    if len(files) > 1:
+        with ProcessPoolExecutor(max_workers=min(len(files), os.cpu_count() or 1)) as ex:
+            events = list(chain.from_iterable(ex.map(load, files)))
+    else:
+        events = list(chain.from_iterable(map(load, files)))
 
     # sort newest→oldest
-    events.sort(key=lambda e: e["date"], reverse=True)
+    events.sort(key=itemgetter("date"), reverse=True)
 
     timeline = {
         "schema": "timeline.v1",
@@ -107,8 +111,9 @@ def main():
     }
 
     out_path = iso_week_path()
-    with open(out_path, "w", encoding="utf-8") as f:
-        json.dump(timeline, f, ensure_ascii=False, indent=2)
+    with open(out_path, "wb") as f:
+        f.write(orjson.dumps(timeline, option=orjson.OPT_INDENT_2))
+    update_latest_manifest("timeline", out_path)
 
     print(json.dumps({
         "timeline_file": out_path,
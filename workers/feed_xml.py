@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# Streaming RSS/Atom item reader (lxml), shared by weekly_main.py and workers/weekly_discover.py.
+# Mirrors what the callers used from feedparser: title, link, summary and publish date.
+
+import io
+from urllib.parse import urljoin
+from lxml import etree
+
+FEED_ITEM_TAGS = ("{*}item", "{*}entry")  # RSS 0.9x/2.0 + RSS 1.0 (RDF) items, Atom entries
+DATE_TAGS = ("{*}pubDate", "{*}published", "{*}updated", "{*}date")  # dc:date last
+SUMMARY_TAGS = ("{*}description", "{*}summary", "{*}content", "{*}encoded")  # content:encoded last
+
+def item_link(el, base=""):
+    """First <link> with text (RSS), else rel=alternate href (Atom), else a permalink <guid>.
+
+    RSS items often carry an empty <atom:link rel="self" href=.../> before the real <link>,
+    so every link element is checked. Relative links are resolved against `base`; anything
+    that is not http(s) afterwards (tag:/urn: ids, non-permalink guids) yields "".
+    """
+    link = alt = ""
+    for ln in el.iterfind("{*}link"):
+        text = (ln.text or "").strip()
+        if text:
+            link = text
+            break
+        href = (ln.get("href") or "").strip()
+        if href and not alt and ln.get("rel", "alternate") == "alternate":
+            alt = href
+    link = link or alt
+    if not link:
+        guid = el.find("{*}guid")
+        if guid is not None and guid.get("isPermaLink", "true").lower() != "false":
+            link = (guid.text or "").strip()
+    if link and base:
+        link = urljoin(base, link)
+    return link if link.startswith(("http://", "https://")) else ""
+
+def node_text(node):
+    # itertext: a title/summary with inline markup or an XML comment keeps all of its text
+    return "".join(node.itertext()).strip() if node is not None else ""
+
+def item_summary(el):
+    # Escaped HTML arrives as text; type="xhtml" (inline markup) only has text in its descendants
+    for tag in SUMMARY_TAGS:
+        for node in el.iterfind(tag):
+            text = node_text(node)
+            if text:
+                return text
+    return ""
+
+def parse_feed_items(content, parse_date, base=""):
+    """Stream items out of RSS/Atom bytes; `parse_date(str)` returns a datetime or None.
+
+    Returns [{"title", "link", "summary", "published"}] for items with a link. Each item is
+    dropped from the tree once read, so memory stays flat however long the feed is.
+    """
+    entries = []
+    for _, el in etree.iterparse(io.BytesIO(content), events=("end",), tag=FEED_ITEM_TAGS,
+                                 recover=True, resolve_entities=False, no_network=True):
+        link = item_link(el, base)
+        if link:
+            published = None
+            for tag in DATE_TAGS:
+                text = el.findtext(tag)
+                published = parse_date(text) if text else None
+                if published: break
+            entries.append({
+                "title": node_text(el.find("{*}title")),
+                "link": link,
+                "summary": item_summary(el),
+                "published": published,
+            })
+        # Drop the parsed item (and earlier siblings) to keep the tree small
+        el.clear()
+        while el.getprevious() is not None:
+            del el.getparent()[0]
+    return entries
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+# Pointer file so readers find each producer's newest output without globbing + stat'ing
+# the archive. Shared by the writers (process_document, build_timeline) and build_site_data_v2.
+
+import os, tempfile
+import orjson
+
+LATEST_MANIFEST = "outputs/_latest.json"
+
+def write_atomic(path, data):
+    # Temp file in the same directory + os.replace: readers never see a partial file
+    d = os.path.dirname(path) or "."
+    os.makedirs(d, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=d, suffix=".tmp")
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    os.chmod(tmp, 0o644)  # mkstemp creates 0600; outputs must stay world-readable
+    os.replace(tmp, path)
+
+def read_latest_manifest():
+    try:
+        with open(LATEST_MANIFEST, "rb") as f:
+            return orjson.loads(f.read())
+    except Exception:
+        return {}
+
+def update_latest_manifest(key, path):
+    manifest = read_latest_manifest()
+    manifest[key] = path
+    write_atomic(LATEST_MANIFEST, orjson.dumps(manifest, option=orjson.OPT_INDENT_2))
+
+def latest_from_manifest(key):
+    """Path recorded for `key`, or None if missing or the file no longer exists."""
+    p = read_latest_manifest().get(key)
+    return p if p and os.path.exists(p) else None
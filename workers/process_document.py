@@ -3,10 +3,17 @@
 # Safe to run repeatedly; appends NDJSON per ISO week under outputs/docs/.
 
 import argparse, os, sys, json, re, hashlib
+from concurrent.futures import ThreadPoolExecutor
+import orjson
+from latest_manifest import update_latest_manifest
 from datetime import datetime, timezone
+from functools import lru_cache
 from urllib.parse import urljoin
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import lxml.html
+from lxml import etree
 from dateutil import parser as dtparse
 
 # Optional: OpenAI summarisation (falls back automatically)
@@ -18,9 +25,20 @@ except Exception:
     USE_OPENAI = False
     OPENAI_CLIENT = None
 
+# Optional: RE2 multi-pattern matching for the classifiers (falls back to stdlib re)
+try:
+    import re2
+except ImportError:
+    re2 = None
+
 UA = "Mozilla/5.0 (compatible; EU-Innovation-Monitor/1.0)"
 SESSION = requests.Session()
 SESSION.headers.update({"User-Agent": UA, "Accept-Language": "en-GB,en;q=0.8"})
+# Pool sized for the worker threads (default is 10 per host); retry transient gateway errors
+_ADAPTER = HTTPAdapter(pool_connections=32, pool_maxsize=32,
+                       max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504)))
+SESSION.mount("https://", _ADAPTER)
+SESSION.mount("http://", _ADAPTER)
 TIMEOUT = 25
 
 def iso_now():
@@ -29,6 +47,11 @@ def iso_now():
 def safe_parse_dt(s):
     if not s:
         return None
+    return _parse_dt_cached(s)
+
+@lru_cache(maxsize=4096)
+def _parse_dt_cached(s):
+    # dateutil is slow and the same meta/hint strings recur across a batch; failures are cached as None
     try:
         d = dtparse.parse(s, dayfirst=True)
         if d.tzinfo is None:
@@ -37,29 +60,77 @@ def safe_parse_dt(s):
     except Exception:
         return None
 
+MAX_PAGE_BYTES = 8 * 1024 * 1024  # stop feeding the parser past this (pathological pages)
+
+_XP_MAIN = etree.XPath("(//main | //article)[1]")
+_XP_P = etree.XPath(".//p")
+_XP_H1 = etree.XPath("(//h1)[1]")
+_XP_OG_TITLE = etree.XPath("(//meta[@property='og:title'])[1]")
+_XP_TITLE = etree.XPath("(//title)[1]")
+_XP_DATE_NODES = [
+    etree.XPath("(//meta[@property='article:published_time'])[1]"),
+    etree.XPath("(//time[@datetime])[1]"),
+    etree.XPath("(//meta[@name='date'])[1]"),
+]
+_XP_HEADER = etree.XPath("(//header | //main | //article)[1]")
+
 def fetch(url):
-    r = SESSION.get(url, timeout=TIMEOUT)
-    r.raise_for_status()
-    return r.text, r.url
+    """Stream the response body straight into lxml's incremental HTML parser.
 
-def extract_main(soup):
-    root = soup.find(["main", "article"]) or soup
-    ps = [p.get_text(" ", strip=True) for p in root.select("p") if p.get_text(strip=True)]
+    No full-body bytes/str copies are held next to the tree. The charset comes from
+    the Content-Type header when given, otherwise libxml2 sniffs the <meta> tag.
+    Non-HTML responses (PDF, JSON, binaries) return tree=None without reading the body.
+    """
+    with SESSION.get(url, timeout=TIMEOUT, stream=True) as r:
+        r.raise_for_status()
+        content_type = r.headers.get("Content-Type", "").lower()
+        if content_type and "html" not in content_type and "xml" not in content_type:
+            return None, r.url, content_type
+        charset = None
+        if "charset=" in content_type:
+            charset = requests.utils.get_encoding_from_headers(r.headers)
+        try:
+            parser = lxml.html.HTMLParser(encoding=charset)
+        except LookupError:
+            parser = lxml.html.HTMLParser()
+        size = 0
+        for chunk in r.iter_content(chunk_size=64 * 1024):
+            parser.feed(chunk)
+            size += len(chunk)
+            if size >= MAX_PAGE_BYTES:
+                break
+        tree = parser.close()
+        final_url = r.url
+    etree.strip_elements(tree, "script", "style", with_tail=False)
+    return tree, final_url, content_type
+
+def node_text(el):
+    # Equivalent of BeautifulSoup's get_text(" ", strip=True)
+    return " ".join(t for t in (s.strip() for s in el.itertext()) if t)
+
+def extract_main(tree):
+    root = (_XP_MAIN(tree) or [tree])[0]
+    ps = [t for t in (node_text(p) for p in _XP_P(root)) if t]
     text = "\n".join(ps)
     return text[:50000]
 
-def extract_title(soup):
-    for sel in ["h1", "meta[property='og:title']"]:
-        el = soup.select_one(sel)
-        if el:
-            return el.get_text(" ", strip=True) if el.name == "h1" else (el.get("content") or "").strip()
-    return (soup.title.get_text(" ", strip=True) if soup.title else None)
+def extract_title(tree):
+    h1 = _XP_H1(tree)
+    if h1:
+        return node_text(h1[0])
+    og = _XP_OG_TITLE(tree)
+    if og:
+        return (og[0].get("content") or "").strip()
+    t = _XP_TITLE(tree)
+    return node_text(t[0]) if t else None
 
-def extract_date(soup, hint=None):
-    for sel in ["meta[property='article:published_time']", "time[datetime]", "meta[name='date']"]:
-        el = soup.select_one(sel)
+_TEXT_DATE_RE = re.compile(r"\b(\d{1,2}\s+[A-Za-z]{3,9}\s+\d{4})\b")
+
+def extract_date(tree, hint=None):
+    for xp in _XP_DATE_NODES:
+        el = xp(tree)
         if el:
-            val = el.get("content") or el.get("datetime")
+            val = el[0].get("content") or el[0].get("datetime")
             d = safe_parse_dt(val)
             if d:
                 return d
@@ -67,17 +138,18 @@ def extract_date(soup, hint=None):
         d = safe_parse_dt(hint)
         if d:
             return d
-    header = soup.find(["header", "main", "article"]) or soup
-    txt = header.get_text(" ", strip=True)
-    m = re.search(r"\b(\d{1,2}\s+[A-Za-z]{3,9}\s+\d{4})\b", txt)
+    header = (_XP_HEADER(tree) or [tree])[0]
+    txt = node_text(header)
+    m = _TEXT_DATE_RE.search(txt)
     if m:
         d = safe_parse_dt(m.group(1))
         if d:
             return d
     return datetime.now(timezone.utc)
 
-def detect_doc_type(text):
-    t = text.lower()
+# The detect_* helpers take text already lower-cased once by the caller
+
+def detect_doc_type(t):
     if "press release" in t or "press" in t[:200]:
         return "Press_Release"
     if "call for proposals" in t:
@@ -90,9 +162,8 @@ def detect_doc_type(text):
         return "Report"
     return "Blog/News"
 
-def detect_programme(text, base_domain):
+def detect_programme(t, base_domain):
     labs = set()
-    t = text.lower()
     if "investeu" in t or "invest eu" in t or "investeu" in base_domain:
         labs.add("InvestEU")
     if "european defence fund" in t or "edf" in t:
@@ -101,53 +172,78 @@ def detect_programme(text, base_domain):
         labs.add("EIB")
     if "european investment fund" in t or "eif" in t:
         labs.add("EIF")
-    if "asap" in t and "support act" in t.lower():
+    if "asap" in t and "support act" in t:
         labs.add("ASAP")
     return sorted(labs) or ["Other/NA"]
 
-def detect_instrument(text):
-    t = text.lower()
-    labs = []
-    if re.search(r"\bgrant(s)?\b", t):
-        labs.append("Grant")
-    if re.search(r"\bguarantee(s)?|guarantee facility\b", t):
-        labs.append("Guarantee")
-    if re.search(r"\bequity\b|\bventure\b|\bfund of funds\b", t):
-        labs.append("Equity/Venture")
-    if re.search(r"\bloan(s)?\b|\bframework loan\b", t):
-        labs.append("Loan")
-    if re.search(r"\bprocurement\b|\btender\b", t):
-        labs.append("Procurement")
-    if re.search(r"\blisting\b|\bipo\b", t):
-        labs.append("Listing/Market")
+# (pattern, label) pairs compiled once; matched against lower-cased text.
+# re.ASCII: RE2's \b is ASCII-only, so the stdlib fallback uses the same word boundaries
+_INSTRUMENT_PATTERNS = [
+    (re.compile(r"\bgrant(s)?\b", re.ASCII), "Grant"),
+    (re.compile(r"\bguarantee(s)?|guarantee facility\b", re.ASCII), "Guarantee"),
+    (re.compile(r"\bequity\b|\bventure\b|\bfund of funds\b", re.ASCII), "Equity/Venture"),
+    (re.compile(r"\bloan(s)?\b|\bframework loan\b", re.ASCII), "Loan"),
+    (re.compile(r"\bprocurement\b|\btender\b", re.ASCII), "Procurement"),
+    (re.compile(r"\blisting\b|\bipo\b", re.ASCII), "Listing/Market"),
+]
+
+def _pattern_set(patterns):
+    # One RE2 SearchSet reports every matching pattern in a single linear pass; None without re2
+    if re2 is None:
+        return None
+    try:
+        ps = re2.Set.SearchSet()
+        for rx in patterns:
+            ps.Add(rx)
+        ps.Compile()
+        return ps
+    except Exception:
+        return None
+
+_INSTRUMENT_SET = _pattern_set(rx.pattern for rx, _ in _INSTRUMENT_PATTERNS)
+
+def detect_instrument(t):
+    if _INSTRUMENT_SET is not None:
+        hits = set(_INSTRUMENT_SET.Match(t) or ())
+        labs = [label for i, (_, label) in enumerate(_INSTRUMENT_PATTERNS) if i in hits]
+    else:
+        labs = [label for rx, label in _INSTRUMENT_PATTERNS if rx.search(t)]
     return labs or (["Procurement"] if "tender" in t else [])
 
+# Patterns are written lower-case: they run against lower-cased text, so no IGNORECASE is needed
 TECH_MAP = {
-    "AI/Autonomy": r"\bAI\b|\bartificial intelligence\b|\bautonom(y|ous)\b|\bC4ISR\b|\bcommand\b",
+    "AI/Autonomy": r"\bai\b|\bartificial intelligence\b|\bautonom(?:y|ous)\b|\bc4isr\b|\bcommand\b",
     "Advanced_Semiconductors": r"\bsemiconductor|chip|node\b|\bphotonic\b",
     "Quantum": r"\bquantum\b",
-    "Biotech": r"\bbiotech|bio(tech|technology)\b",
-    "Space/EO": r"\bsatellite|earth observation|EO\b|\bGNSS\b",
-    "Cybersecurity": r"\bcyber|SOC|threat intel|zero trust\b",
-    "Advanced_Computing/HPC": r"\bHPC|supercomput(ing|er)\b",
-    "Robotics/Drones": r"\bdrone|UAV|UAS|robotics|swarm\b",
+    "Biotech": r"\bbiotech|bio(?:tech|technology)\b",
+    "Space/EO": r"\bsatellite|earth observation|eo\b|\bgnss\b",
+    "Cybersecurity": r"\bcyber|soc|threat intel|zero trust\b",
+    "Advanced_Computing/HPC": r"\bhpc|supercomput(?:ing|er)\b",
+    "Robotics/Drones": r"\bdrone|uav|uas|robotics|swarm\b",
     "Advanced_Materials": r"\bcomposite|graphene|advanced materials\b",
     "Energy_Tech": r"\bbattery|hydrogen|fusion|energy storage\b",
-    "Communications/5G+/SatCom": r"\b5G|6G|satcom|optical comm\b",
-    "Positioning/Navigation/Timing": r"\bPNT|navigation|GNSS\b"
+    "Communications/5G+/SatCom": r"\b5g|6g|satcom|optical comm\b",
+    "Positioning/Navigation/Timing": r"\bpnt|navigation|gnss\b"
 }
 
-def detect_tech(text):
-    t = text.lower()
-    labels = []
-    for k, rx in TECH_MAP.items():
-        if re.search(rx, t, flags=re.IGNORECASE):
-            labels.append(k)
-    return labels
+_TECH_COMPILED = [(re.compile(rx, re.ASCII), k) for k, rx in TECH_MAP.items()]  # ASCII \b, as RE2
+_TECH_SET = _pattern_set(TECH_MAP.values())
+
+def detect_tech(t):
+    if _TECH_SET is not None:
+        hits = set(_TECH_SET.Match(t) or ())
+        return [k for i, k in enumerate(TECH_MAP) if i in hits]
+    return [k for rx, k in _TECH_COMPILED if rx.search(t)]
+
+# Currency token is a literal set (no IGNORECASE) so it matches the prefilter below; units stay case-insensitive
+_AMOUNT_RE = re.compile(r"(€|\bEUR\b|\beur\b)\s*([\d\.,\s]+)\s*((?i:billion|bn|million|mn|m))?")
 
 def extract_amounts(text):
+    # Literal prefilter: most pages carry no amounts, so skip the regex scan entirely
+    if "€" not in text and "EUR" not in text and "eur" not in text:
+        return []
     amounts = []
-    for m in re.finditer(r"(€|\bEUR\b)\s*([\d\.,\s]+)\s*(billion|bn|million|mn|m)?", text, flags=re.IGNORECASE):
+    for m in _AMOUNT_RE.finditer(text):
         raw = m.group(2).replace(" ", "")
         unit = (m.group(3) or "").lower()
         try:
@@ -159,7 +255,13 @@ def extract_amounts(text):
         elif unit in ("million", "mn", "m"):
             val *= 1_000_000
         amounts.append({"amount": val, "currency": "EUR", "label": "stated_value"})
-    return amounts[:5]
+        if len(amounts) == 5:
+            break
+    return amounts
+
+SUMMARY_WORKERS = 5  # concurrent summarisation requests
+
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[\.\?\!])\s+")
 
 def summarise_150w(title, text):
     body = text[:4000]
@@ -183,7 +285,7 @@ def summarise_150w(title, text):
             return resp.choices[0].message.content.strip()
         except Exception:
             pass
-    sentences = re.split(r"(?<=[\.\?\!])\s+", text)
+    sentences = _SENTENCE_SPLIT_RE.split(text)
     cut = " ".join(sentences[:7])
     return (cut[:1450] + "…") if len(cut) > 1450 else cut
 
@@ -196,6 +298,80 @@ def week_path():
 def sha256(s):
     return hashlib.sha256(s.encode("utf-8")).hexdigest()
 
+SEEN_PATH = "state/seen_signatures.txt"  # newline-delimited hex, persists across runs
+
+def load_seen():
+    try:
+        with open(SEEN_PATH, "r", encoding="utf-8") as f:
+            return {line.strip() for line in f if line.strip()}
+    except FileNotFoundError:
+        return set()
+
+def prefetch_signature(it):
+    # Cheap pre-fetch key from the discovery item alone, so seen items cost no network/LLM work
+    key = "\x1f".join((it.get("url") or "", it.get("title_hint") or "", it.get("published_date_hint") or ""))
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+
+def process_one(it):
+    """Fetch, extract and classify one item; returns (record, main text) or None on failure.
+
+    summary_150w is left empty here and filled in by the summarisation phase.
+    """
+    url = it.get("url")
+    title_hint = it.get("title_hint")
+    published_hint = it.get("published_date_hint")
+    try:
+        tree, final_url, _ = fetch(url)
+        if tree is None:
+            return None  # not an HTML page: skip before parsing/classifying
+        title = extract_title(tree) or title_hint or "(untitled)"
+        text = extract_main(tree)
+        pub_dt = extract_date(tree, hint=published_hint)
+        text_lc = text.lower()
+        doc_type = detect_doc_type(text_lc)
+        programme = detect_programme(text_lc, base_domain=final_url)
+        instrument = detect_instrument(text_lc)
+        tech = detect_tech(text_lc)
+        amounts = extract_amounts(text)  # article body only; no second full-DOM walk
+        dedupe = sha256((final_url or url) + title + (pub_dt.isoformat() if pub_dt else ""))
+
+        rec = {
+            "schema": "document.v2",
+            "source_id": "investeu_news",
+            "url": final_url or url,
+            "canonical_url": final_url or url,
+            "fetch_time": iso_now(),
+            "language": "en",
+            "title": title,
+            "published_date": pub_dt.isoformat() if pub_dt else iso_now(),
+            "updated_date": None,
+            "doc_type": doc_type,
+            "programme": programme,
+            "finance_instrument": instrument,
+            "stage": None,
+            "actors": [],
+            "tech_area": tech,
+            "monetary_values": amounts,
+            "summary_150w": None,
+            "key_points": [],
+            "implications": {
+                "innovation_direction": [],
+                "capital_structure": [],
+                "regulatory_change": []
+            },
+            "links": {"pdf": [], "dataset": [], "related": []},
+            "celex_id": None,
+            "call_id": None,
+            "award_id": None,
+            "tags": [],
+            "dedupe_signature": dedupe,
+            "embeddings": None,
+            "extraction_notes": None
+        }
+    except Exception:
+        return None
+    return rec, text
+
 def main():
     ap = argparse.ArgumentParser()
     ap.add_argument("--from", dest="queue", required=False, default="state/latest_discovery.json",
@@ -215,72 +391,54 @@ def main():
     for src in agg.get("sources", []):
         for it in src.get("items", []):
             items.append(it)
-    items = items[: args.limit]
+
+    # Skip anything processed in an earlier run (or repeated within this queue); the same
+    # page listed by several sources/hints is fetched once
+    seen = load_seen()
+    seen_urls = set()
+    fresh, sigs = [], []
+    for it in items:
+        sig = prefetch_signature(it)
+        url = it.get("url")
+        if sig in seen or url in seen_urls:
+            continue
+        seen.add(sig)
+        seen_urls.add(url)
+        fresh.append(it)
+        sigs.append(sig)
+    items, sigs = fresh[: args.limit], sigs[: args.limit]
 
     out_file = week_path()
     processed = 0
     written_urls = []
 
-    for it in items:
-        url = it.get("url")
-        title_hint = it.get("title_hint")
-        published_hint = it.get("published_date_hint")
-        try:
-            html, final_url = fetch(url)
-            soup = BeautifulSoup(html, "lxml")
-            title = extract_title(soup) or title_hint or "(untitled)"
-            text = extract_main(soup)
-            pub_dt = extract_date(soup, hint=published_hint)
-            doc_type = detect_doc_type(text)
-            programme = detect_programme(text, base_domain=final_url)
-            instrument = detect_instrument(text)
-            tech = detect_tech(text)
-            amounts = extract_amounts(soup.get_text(" ", strip=True))
-            summary = summarise_150w(title, text)
-            dedupe = sha256((final_url or url) + title + (pub_dt.isoformat() if pub_dt else ""))
-
-            rec = {
-                "schema": "document.v2",
-                "source_id": "investeu_news",
-                "url": final_url or url,
-                "canonical_url": final_url or url,
-                "fetch_time": iso_now(),
-                "language": "en",
-                "title": title,
-                "published_date": pub_dt.isoformat() if pub_dt else iso_now(),
-                "updated_date": None,
-                "doc_type": doc_type,
-                "programme": programme,
-                "finance_instrument": instrument,
-                "stage": None,
-                "actors": [],
-                "tech_area": tech,
-                "monetary_values": amounts,
-                "summary_150w": summary,
-                "key_points": [],
-                "implications": {
-                    "innovation_direction": [],
-                    "capital_structure": [],
-                    "regulatory_change": []
-                },
-                "links": {"pdf": [], "dataset": [], "related": []},
-                "celex_id": None,
-                "call_id": None,
-                "award_id": None,
-                "tags": [],
-                "dedupe_signature": dedupe,
-                "embeddings": None,
-                "extraction_notes": None
-            }
-
-            with open(out_file, "a", encoding="utf-8") as wf:
-                wf.write(json.dumps(rec, ensure_ascii=False) + "\n")
-
-            processed += 1
-            written_urls.append(final_url or url)
+    # Phase 1: fetch + extract + classify (independent, I/O-bound; map() keeps input order)
+    workers = max(1, min(8, len(items)))
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        results = list(ex.map(process_one, items))
+    done = [r for r in results if r is not None]
+    new_sigs = [sig for r, sig in zip(results, sigs) if r is not None]
 
-        except Exception:
-            continue
+    # Phase 2: all summaries in flight together, capped to stay inside OpenAI rate limits
+    if done:
+        with ThreadPoolExecutor(max_workers=min(SUMMARY_WORKERS, len(done))) as ex:
+            summaries = list(ex.map(lambda r: summarise_150w(r[0]["title"], r[1]), done))
+        for (rec, _), summary in zip(done, summaries):
+            rec["summary_150w"] = summary
+
+    # Records are written from this thread only, so one buffered handle (no lock) suffices
+    if done:
+        with open(out_file, "a", encoding="utf-8", buffering=1 << 16) as wf:
+            for rec, _ in done:
+                wf.write(orjson.dumps(rec).decode() + "\n")
+                processed += 1
+                written_urls.append(rec["url"])
+
+    if processed:
+        update_latest_manifest("ndjson", out_file)
+        os.makedirs(os.path.dirname(SEEN_PATH), exist_ok=True)
+        with open(SEEN_PATH, "a", encoding="utf-8") as f:
+            f.write("".join(sig + "\n" for sig in new_sigs))
 
     print(json.dumps({"processed": processed, "ndjson": out_file, "urls": written_urls}, ensure_ascii=False))
 
@@ -1,17 +1,27 @@
 #!/usr/bin/env python3
 # Bridge: v2 -> legacy site payloads (root én /site), met taxonomy uit config.yml.
 
-import os, json, glob, re, yaml
+import os, json, re, heapq, yaml
+import orjson
+from latest_manifest import write_atomic
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from operator import itemgetter
 from dateutil import parser as dtparse
 
+try:  # libyaml C bindings when PyYAML was built with them
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 ROOT_DIR = "docs"
 SITE_DIR = "docs/site"
 DATA_DIR = "docs/data"
 CONFIG_YAML = "config.yml"
 
-NDJSON_GLOB = "outputs/docs/*.ndjson"
-TIMELINE_GLOB = "outputs/timelines/*.json"
+NDJSON_DIR = "outputs/docs"
+TIMELINE_DIR = "outputs/timelines"
 DAILY_LATEST = "docs/digests/latest.json"
 
 SOURCE_LABELS = {
@@ -23,7 +33,9 @@ SOURCE_LABELS = {
     "nato_news": "NATO", "rand_press": "RAND", "bruegel_publications": "Bruegel",
 }
 
-MAJOR_PROGRAMMES = {"InvestEU","EIB","EIF","EDF","ESMA"}
+MAJOR_PROGRAMMES = frozenset({"InvestEU","EIB","EIF","EDF","ESMA"})
+DERISKING_PROGRAMMES = frozenset({"InvestEU","EIB","EIF"})
+GUIDANCE_DOC_TYPES = frozenset({"guidance/notice","call_for_proposals","work_programme"})
 
 def ensure_dirs():
     os.makedirs(ROOT_DIR, exist_ok=True)
@@ -32,6 +44,18 @@ def ensure_dirs():
 
 def parse_dt(s):
     if not s: return None
+    return _parse_dt_cached(s)
+
+@lru_cache(maxsize=4096)
+def _parse_dt_cached(s):
+    # Memoised: dateutil is slow and records often share timestamp strings; failures cache as None.
+    # Our own writers emit isoformat(), which the C fromisoformat handles; dateutil is the fallback.
+    try:
+        d = datetime.fromisoformat(s)
+        if d.tzinfo is None: d = d.replace(tzinfo=timezone.utc)
+        return d
+    except ValueError:
+        pass
     try:
         d = dtparse.parse(s)
         if d.tzinfo is None: d = d.replace(tzinfo=timezone.utc)
@@ -39,31 +63,41 @@ def parse_dt(s):
     except Exception:
         return None
 
-def load_ndjson(glob_pat):
-    recs = []
-    for path in sorted(glob.glob(glob_pat)):
-        with open(path, "r", encoding="utf-8") as f:
+def scan(directory, suffix):
+    # One directory pass; DirEntry caches stat results, unlike glob + getmtime
+    try:
+        with os.scandir(directory) as it:
+            return [e for e in it if e.name.endswith(suffix) and not e.name.startswith(".") and e.is_file()]
+    except FileNotFoundError:
+        return []
+
+def iter_documents(directory, suffix=".ndjson"):
+    # Streams document.v2 records shard by shard (oldest week first); nothing is buffered here
+    for e in sorted(scan(directory, suffix), key=lambda e: e.name):
+        with open(e.path, "rb", buffering=1 << 20) as f:
             for line in f:
-                line=line.strip()
-                if not line: continue
+                if not line.strip(): continue
                 try:
-                    obj = json.loads(line)
-                    if obj.get("schema") == "document.v2":
-                        recs.append(obj)
+                    obj = orjson.loads(line)
                 except Exception:
                     continue
-    return recs
+                if isinstance(obj, dict) and obj.get("schema") == "document.v2":
+                    yield obj
 
-def latest_file(glob_pat):
-    files = sorted(glob.glob(glob_pat), key=lambda p: os.path.getmtime(p), reverse=True)
-    return files[0] if files else None
+def latest_file(directory, suffix):
+    best, best_m = None, -1.0
+    for e in scan(directory, suffix):
+        m = e.stat().st_mtime
+        if m > best_m:
+            best, best_m = e.path, m
+    return best
 
 def load_taxonomy():
     """Lees config.yml en geef [(category_name, [regex/strings...]), ...] terug."""
     if not os.path.exists(CONFIG_YAML):
         return []
-    with open(CONFIG_YAML, "r", encoding="utf-8") as f:
-        cfg = yaml.safe_load(f)
+    with open(CONFIG_YAML, "rb") as f:
+        cfg = yaml.load(f, Loader=YamlLoader)
     cats = []
     for cat in (cfg.get("taxonomy", {}).get("categories", []) or []):
         name = cat.get("name")
@@ -74,18 +108,29 @@ def load_taxonomy():
             cats.append((name, pat))
     return cats
 
-def categorise(rec, taxo):
+def rec_view(rec):
+    """Velden die categorise/score_key/map_live nodig hebben, één keer per record uitgelezen."""
+    progs = rec.get("programme") or []
+    techs = rec.get("tech_area") or []
+    return {
+        "progs": progs,
+        "prog_set": frozenset(progs),
+        "techs": techs,
+        "sid": rec.get("source_id",""),
+        "doc_type": rec.get("doc_type"),
+    }
+
+def categorise(rec, view, taxo):
     """Eerst regels op basis van programma/bron; dan keywords uit config.yml; dan fallback."""
-    progs = set(rec.get("programme") or [])
-    techs = set(rec.get("tech_area") or [])
-    sid = rec.get("source_id","")
+    progs = view["prog_set"]
+    sid = view["sid"]
     if "EDF" in progs or sid in {"helsing_news","anduril_news","boeing_press","airbus_press","nato_news"}:
         return "Defence & Security"
     if "ESMA" in progs or "afme" in sid:
         return "CMU & Financial Markets"
-    if techs:
+    if view["techs"]:
         return "AI & Digital"
-    if progs & {"InvestEU","EIB","EIF"} or sid == "investnl_news":
+    if not DERISKING_PROGRAMMES.isdisjoint(progs) or sid == "investnl_news":
         return "De-risking & Investment"
 
     text = (rec.get("title") or "") + " " + (rec.get("summary_150w") or "")
@@ -94,39 +139,38 @@ def categorise(rec, taxo):
             return name
     return "Other"
 
-def map_live(rec, taxo):
+def map_live(rec, view, taxo):
     title = rec.get("title") or "(untitled)"
     url = rec.get("canonical_url") or rec.get("url")
     date = rec.get("published_date") or rec.get("fetch_time")
     src_id = rec.get("source_id","unknown")
     src = SOURCE_LABELS.get(src_id, src_id)
-    tags = (rec.get("tech_area") or []) + (rec.get("programme") or [])
+    tags = view["techs"] + view["progs"]
     return {
         "title": title,
         "url": url,
         "source_id": src_id,
         "source": src,
         "date": date,
-        "doc_type": rec.get("doc_type") or "News",
+        "doc_type": view["doc_type"] or "News",
         "tags": tags[:12],
-        "category": categorise(rec, taxo)
+        "category": categorise(rec, view, taxo)
     }
 
-def score_key(rec):
+def score_key(rec, view):
     score = 0
     if rec.get("monetary_values"): score += 3
-    if set(rec.get("programme") or []) & MAJOR_PROGRAMMES: score += 2
-    if rec.get("tech_area"): score += 1
-    if (rec.get("doc_type") or "").lower() in {"guidance/notice","call_for_proposals","work_programme"}:
+    if not MAJOR_PROGRAMMES.isdisjoint(view["progs"]): score += 2
+    if view["techs"]: score += 1
+    if (view["doc_type"] or "").lower() in GUIDANCE_DOC_TYPES:
         score += 2
     return score
 
 def write_json(obj, *paths):
+    # Serialise once for all targets; atomic so site readers never see a partial file
+    data = orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
     for p in paths:
-        d = os.path.dirname(p)
-        if d: os.makedirs(d, exist_ok=True)
-        with open(p, "w", encoding="utf-8") as f:
-            json.dump(obj, f, ensure_ascii=False)
+        write_atomic(p, data)
 
 def main():
     ensure_dirs()
@@ -134,45 +178,67 @@ def main():
     taxonomy = load_taxonomy()
 
     # Live feed: laatste 30 dagen
-    records = load_ndjson(NDJSON_GLOB)
     cutoff = now - timedelta(days=30)
-    recent = []
-    for r in records:
-        d = parse_dt(r.get("published_date") or r.get("fetch_time"))
+    # Offsets can shift the UTC date, so the string prefilter keeps a day of slack
+    cutoff_day = (cutoff - timedelta(days=1)).date().isoformat()
+    # One streaming pass: filter + dedupe while reading, so only in-window records are held.
+    # Keyed by dedupe_signature (url as fallback): a document re-processed in a later week
+    # replaces (or, if now out of window, removes) its earlier line instead of appearing twice.
+    latest = {}
+    for n, r in enumerate(iter_documents(NDJSON_DIR)):
+        key = r.get("dedupe_signature") or r.get("url") or n
+        pd = r.get("published_date") or r.get("fetch_time") or ""
+        # ISO dates well before the cutoff are dropped on a string compare, without parsing
+        d = None if (pd[4:5] == "-" and pd[:10] < cutoff_day) else parse_dt(pd)
         if d and d >= cutoff:
-            recent.append(r)
-    recent.sort(key=lambda r: r.get("published_date") or r.get("fetch_time") or "", reverse=True)
+            latest[key] = (d, r)
+        else:
+            latest.pop(key, None)
+    dated = []
+    for d, r in latest.values():
+        v = rec_view(r)
+        dated.append((d, score_key(r, v), r, v))
+    recent = [x[2] for x in dated]
 
-    live_items = [map_live(r, taxonomy) for r in recent[:200]]
-    key_items = [map_live(r, taxonomy) for r in sorted(recent, key=score_key, reverse=True)[:20]]
+    # Only the top 200 / top 20 are used: bounded heaps instead of full sorts.
+    # Key items rank by score, newest first among equal scores (scores are small ints, ties are common)
+    mapped = {}
+    def live(x):
+        # Records in both lists are mapped (and categorised) once
+        k = id(x[2])
+        if k not in mapped:
+            mapped[k] = map_live(x[2], x[3], taxonomy)
+        return mapped[k]
+    live_items = [live(x) for x in heapq.nlargest(200, dated, key=itemgetter(0))]
+    key_items = [live(x) for x in heapq.nlargest(20, dated, key=itemgetter(1, 0))]
 
     # Timeline
     reports_timeline = {"schema":"timeline.v1","events":[]}
-    tl_file = latest_file(TIMELINE_GLOB)
+    tl_file = latest_file(TIMELINE_DIR, ".json")
     if tl_file:
-        with open(tl_file, "r", encoding="utf-8") as f:
-            reports_timeline = json.load(f)
+        with open(tl_file, "rb") as f:
+            reports_timeline = orjson.loads(f.read())
 
     # Daily digest (laatste)
     digest_latest = None
     if os.path.exists(DAILY_LATEST):
-        with open(DAILY_LATEST, "r", encoding="utf-8") as f:
-            digest_latest = json.load(f)
+        with open(DAILY_LATEST, "rb") as f:
+            digest_latest = orjson.loads(f.read())
 
     # Schrijf site + root (legacy)
-    write_json({"generated_at": now.isoformat(), "items": live_items},
-               f"{SITE_DIR}/live.json", f"{ROOT_DIR}/live.json")
-    write_json({"generated_at": now.isoformat(), "items": key_items},
-               f"{SITE_DIR}/key-items.json", f"{ROOT_DIR}/key-items.json")
-    write_json(reports_timeline,
-               f"{SITE_DIR}/reports_timeline.json", f"{ROOT_DIR}/reports_timeline.json")
+    writes = [
+        ({"generated_at": now.isoformat(), "items": live_items},
+         (f"{SITE_DIR}/live.json", f"{ROOT_DIR}/live.json")),
+        ({"generated_at": now.isoformat(), "items": key_items},
+         (f"{SITE_DIR}/key-items.json", f"{ROOT_DIR}/key-items.json")),
+        # Houd v2 payloads ook bij
+        (reports_timeline,
+         (f"{SITE_DIR}/reports_timeline.json", f"{ROOT_DIR}/reports_timeline.json")
+         + ((f"{DATA_DIR}/timeline-latest.json",) if tl_file else ())),
+    ]
     if digest_latest:
-        write_json(digest_latest,
-                   f"{SITE_DIR}/digest_latest.json", f"{ROOT_DIR}/digest_latest.json")
-
-    # Houd v2 payloads ook bij
-    if tl_file:
-        write_json(reports_timeline, f"{DATA_DIR}/timeline-latest.json")
+        writes.append((digest_latest,
+                       (f"{SITE_DIR}/digest_latest.json", f"{ROOT_DIR}/digest_latest.json")))
 
     # Index/telemetrie
     by_source = {}
@@ -187,7 +253,11 @@ def main():
         "key_items": len(key_items),
         "timeline_events": len(reports_timeline.get("events", []))
     }
-    write_json(index, f"{SITE_DIR}/index.json", f"{ROOT_DIR}/index.json")
+    writes.append((index, (f"{SITE_DIR}/index.json", f"{ROOT_DIR}/index.json")))
+
+    # Independent files: overlap the I/O waits (list() re-raises any write error)
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        list(ex.map(lambda w: write_json(w[0], *w[1]), writes))
 
     print(json.dumps({"status":"ok","live":len(live_items),"key":len(key_items),
                       "timeline_events":len(reports_timeline.get("events",[]))}, ensure_ascii=False))
@@ -14,7 +14,7 @@ The output structure is intentionally simple and stable:
   "cutoff_utc": "<ISO8601 UTC>",
   "items": [
     {
-      "id": "<stable hash of url>",
+      "id": "<stable hash of url (blake2b-80 hex)>",
       "source": "<source name or host>",
       "title": "<title>",
       "url": "<absolute url>",
@@ -32,7 +32,7 @@ USAGE (as in your workflow):
   python workers/weekly_discover.py --window 1d --sources sources_v2.yaml --config config_v2.yaml
 
 Notes:
-- Uses `feedparser` first for feeds (robust), and falls back to tolerant BeautifulSoup.
+- Parses feeds with lxml first (fast), then `feedparser` (robust), then tolerant BeautifulSoup.
 - Never lets a single broken source crash the run; errors are logged and the loop continues.
 - If everything fails, it still writes a valid (empty) state file so the pipeline continues.
 """
@@ -40,54 +40,92 @@ Notes:
 from __future__ import annotations
 
 import argparse
+import email.utils
 import hashlib
 import json
 import os
 import re
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import urljoin, urlparse, urlunparse
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import feedparser  # tolerant feed parser
 from bs4 import BeautifulSoup  # tolerant HTML/XML via helper below
 from dateutil import parser as dateparse
 import yaml
 
+try:  # libyaml C bindings when PyYAML was built with them
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+from feed_xml import parse_feed_items  # lxml RSS/Atom reader shared with weekly_main.py
+
+# Optional: lexbor-backed HTML parsing for link extraction (falls back to BeautifulSoup)
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
 USER_AGENT = "Mozilla/5.0 (compatible; PipelineV2/1.0; +https://example.com)"
 REQ_TIMEOUT = 20
 MAX_HTML_LINKS = 200  # soft cap per page
+DISCOVER_WORKERS = 8  # sources fetched concurrently
+HOST_MIN_GAP_S = 0.25  # politeness: minimum gap between requests to the same host
+
+# Shared keep-alive session: repeat requests to a host skip the TCP/TLS handshake.
+# Pool sized for the worker threads; retries honour Retry-After on 429.
+SESSION = requests.Session()
+SESSION.headers.update({"User-Agent": USER_AGENT})
+_ADAPTER = HTTPAdapter(pool_connections=32, pool_maxsize=64,
+                       max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 502, 503, 504)))
+SESSION.mount("https://", _ADAPTER)
+SESSION.mount("http://", _ADAPTER)
 
 
 # -------------------------- helpers: parsing & robustness --------------------------
 
+# lxml first (C, recovers from broken markup); html.parser only as a last resort.
+# html5lib is not a dependency, so it is not tried.
+_HTML_PARSERS = ("lxml", "html.parser")
+_XML_PARSERS = ("lxml-xml", "lxml", "html.parser")
+
+
 def safe_soup(markup: str, prefer_xml: bool = False) -> BeautifulSoup:
     """
-    Try multiple parsers so bad XML/feeds don't crash the run.
+    Parse with the first parser that yields any element. lxml virtually always does,
+    so the fallbacks only run when it raises or returns an empty document.
     """
-    parsers_xml_first = ["lxml-xml", "xml", "lxml", "html5lib", "html.parser"]
-    parsers_html_first = ["lxml", "html5lib", "html.parser", "lxml-xml", "xml"]
-    chain = parsers_xml_first if prefer_xml else parsers_html_first
-    last_err: Optional[Exception] = None
-    for p in chain:
+    soup: Optional[BeautifulSoup] = None
+    for p in (_XML_PARSERS if prefer_xml else _HTML_PARSERS):
         try:
-            return BeautifulSoup(markup, p)
+            soup = BeautifulSoup(markup, p)
         except Exception as e:
-            last_err = e
             print(f"[discover] parser={p} failed: {e}", file=sys.stderr)
-    print(f"[discover] falling back to html.parser due to: {last_err}", file=sys.stderr)
-    return BeautifulSoup(markup, "html.parser")
+            continue
+        if soup.find(True) is not None:
+            return soup
+    return soup if soup is not None else BeautifulSoup(markup, "html.parser")
+
 
+_FEED_HEAD_RE = re.compile(rb"<(?:rss|feed[^>]*\bxmlns)", re.IGNORECASE)
+FEED_SNIFF_BYTES = 512  # leading whitespace / BOM / <?xml ...?> before the root tag
 
-def looks_like_feed(text: str, content_type: str) -> bool:
+
+def looks_like_feed(content: bytes, content_type: str) -> bool:
     ct = (content_type or "").lower()
     if "xml" in ct or "rss" in ct or "atom" in ct:
         return True
-    head = text.lstrip()[:300].lower()
-    return ("<rss" in head) or ("<feed" in head and "xmlns" in head)
+    return _FEED_HEAD_RE.search(content, 0, FEED_SNIFF_BYTES) is not None
 
 
 def is_abs_url(u: str) -> bool:
@@ -98,7 +136,9 @@ def is_abs_url(u: str) -> bool:
         return False
 
 
+@lru_cache(maxsize=65536)
 def normalize_url(base: str, href: str) -> str:
+    # Pure in (base, href) and hit repeatedly for nav/footer links shared across pages
     if not href:
         return ""
     href = href.strip()
@@ -113,35 +153,49 @@ def normalize_url(base: str, href: str) -> str:
 
 
 def stable_id(u: str) -> str:
-    return hashlib.sha1(u.encode("utf-8", "ignore")).hexdigest()
+    # Non-cryptographic id: 80-bit blake2b is faster than SHA-1 and ample for dedupe
+    return hashlib.blake2b(u.encode("utf-8", "ignore"), digest_size=10).hexdigest()
 
 
-def parse_date_to_iso(s: str) -> str:
-    if not s:
-        return ""
+def parse_dt_any(s: str) -> Optional[datetime]:
+    """
+    ISO 8601 (our own output, Atom) and RFC 822 (RSS pubDate) go through the C-level
+    stdlib parsers; only other formats pay for dateutil. Raises like dateutil on failure.
+    """
+    s = s.strip()
     try:
-        dt = dateparse.parse(s)
-        if not dt:
-            return ""
-        if not dt.tzinfo:
-            dt = dt.replace(tzinfo=timezone.utc)
-        return dt.astimezone(timezone.utc).isoformat()
-    except Exception:
-        return ""
+        return datetime.fromisoformat(s)
+    except ValueError:
+        pass
+    try:
+        return email.utils.parsedate_to_datetime(s)
+    except (TypeError, ValueError, IndexError):
+        pass
+    return dateparse.parse(s)
 
 
-def within_window(iso_str: str, cutoff_utc: datetime) -> bool:
-    if not iso_str:
-        return True  # keep items with unknown date; downstream can decide
+def parse_published(s: str) -> Tuple[str, Optional[datetime]]:
+    """
+    (ISO8601 UTC string, datetime) for a raw date, or ("", None) if unknown/unparseable.
+    Items carry the datetime as `_published_dt` so the window filter needs no re-parse.
+    """
+    if not s:
+        return "", None
     try:
-        dt = dateparse.parse(iso_str)
+        dt = parse_dt_any(s)
         if not dt:
-            return True
+            return "", None
         if not dt.tzinfo:
             dt = dt.replace(tzinfo=timezone.utc)
-        return dt.astimezone(timezone.utc) >= cutoff_utc
+        dt = dt.astimezone(timezone.utc)
+        return dt.isoformat(), dt
     except Exception:
-        return True
+        return "", None
+
+
+def within_window(dt: Optional[datetime], cutoff_utc: datetime) -> bool:
+    # keep items with unknown date; downstream can decide
+    return dt is None or dt >= cutoff_utc
 
 
 # -------------------------------- config & sources --------------------------------
@@ -188,8 +242,8 @@ class Source:
 
 
 def load_yaml(path: str) -> Dict[str, Any]:
-    with open(path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
+    with open(path, "rb") as f:  # bytes: the loader detects the encoding itself
+        return yaml.load(f, Loader=YamlLoader) or {}
 
 
 def pick_sources(sources_path: Optional[str], config_path: Optional[str]) -> List[Source]:
@@ -223,9 +277,28 @@ def pick_sources(sources_path: Optional[str], config_path: Optional[str]) -> Lis
 
 # ---------------------------------- discovery core ---------------------------------
 
-def fetch(url: str) -> Tuple[str, bytes, Dict[str, str]]:
-    r = requests.get(url, timeout=REQ_TIMEOUT, headers={"User-Agent": USER_AGENT})
-    return r.text, r.content, {k: v for k, v in r.headers.items()}
+def fetch(url: str) -> requests.Response:
+    # Callers read r.content (bytes) and only touch r.text -- charset detection plus a full
+    # decode -- on the HTML path; feeds are parsed straight from bytes.
+    return SESSION.get(url, timeout=REQ_TIMEOUT)
+
+
+def parse_feed_lxml(content: bytes, base: str = "") -> List[Dict[str, Any]]:
+    """
+    Fast path for RSS/Atom via the shared streaming reader (feed_xml.py); relative links
+    are resolved against `base`. Raises / returns [] so the caller can fall back to feedparser.
+    """
+    out: List[Dict[str, Any]] = []
+    for e in parse_feed_items(content, lambda t: parse_published(t)[1], base=base):
+        dt = e["published"]
+        out.append({
+            "title": e["title"],
+            "url": e["link"],
+            "published_at": dt.isoformat() if dt else "",
+            "_published_dt": dt,
+            "summary": e["summary"],
+        })
+    return out
 
 
 def discover_from_feed_bytes(content: bytes) -> List[Dict[str, Any]]:
@@ -243,63 +316,93 @@ def discover_from_feed_bytes(content: bytes) -> List[Dict[str, Any]]:
         )
         if not link:
             continue
+        published_iso, published_dt = parse_published(published)
         out.append({
             "title": title,
             "url": link,
-            "published_at": parse_date_to_iso(published),
+            "published_at": published_iso,
+            "_published_dt": published_dt,
             "summary": (e.get("summary") or e.get("description") or "").strip(),
         })
     return out
 
 
-def discover_from_html(text: str, base_url: str, s: Source) -> List[Dict[str, Any]]:
-    out: List[Dict[str, Any]] = []
+DEFAULT_LINK_CSS = "article a[href], .article a[href], a[href]"  # common article patterns, then all links
+
+
+def _html_candidates(text: str, css: str) -> Tuple[Any, List[Any]]:
+    """(page root, matching nodes in document order) from lexbor when available, else BeautifulSoup."""
+    if LexborHTMLParser is not None:
+        tree = LexborHTMLParser(text)
+        # lexbor repeats a node once per matching group of a selector list; BS4 does not
+        seen: set = set()
+        nodes = [n for n in tree.css(css) if not (n.mem_id in seen or seen.add(n.mem_id))]
+        return tree, nodes
     soup = safe_soup(text, prefer_xml=False)
+    return soup, soup.select(css)
 
-    # Use custom selector if provided
-    candidates: Iterable[Any]
-    if s.selector:
-        candidates = soup.select(s.selector)
-    else:
-        # try common article patterns first, then all links
-        candidates = soup.select("article a[href], .article a[href], a[href]")
 
+def _select_one(node: Any, css: str) -> Any:
+    return node.css_first(css) if LexborHTMLParser is not None else node.select_one(css)
+
+
+def _attr(node: Any, name: str) -> Any:
+    return node.attributes.get(name) if LexborHTMLParser is not None else node.get(name)
+
+
+def _text(node: Any) -> str:
+    if LexborHTMLParser is not None:
+        return node.text(separator=" ", strip=True)
+    return node.get_text(" ", strip=True)
+
+
+def discover_from_html(text: str, base_url: str, s: Source) -> List[Dict[str, Any]]:
+    out: List[Dict[str, Any]] = []
+    # Use custom selector if provided
+    root, candidates = _html_candidates(text, s.selector or DEFAULT_LINK_CSS)
+
+    # The time selector is page-level: resolve it once, not per link
+    published_iso, published_dt = "", None
+    if s.time_selector:
+        tnode = _select_one(root, s.time_selector)
+        if tnode is not None:
+            tval = _attr(tnode, s.time_attr or "datetime") or _text(tnode)
+            if tval:
+                if s.time_format:
+                    try:
+                        published_dt = datetime.strptime(tval, s.time_format).replace(tzinfo=timezone.utc)
+                        published_iso = published_dt.isoformat()
+                    except Exception:
+                        published_iso, published_dt = parse_published(tval)
+                else:
+                    published_iso, published_dt = parse_published(tval)
+
+    # Same article is often linked several times (teaser, heading, "read more"): keep the
+    # first occurrence so repeats neither cost title extraction nor eat the link cap
+    seen_urls: set = set()
     count = 0
     for node in candidates:
         if count >= MAX_HTML_LINKS:
             break
-        href = node.get(s.link_attr or "href")
+        href = _attr(node, s.link_attr or "href")
         if not href:
             continue
         url = normalize_url(s.base or base_url, href)
-        if not url:
+        if not url or url in seen_urls:
             continue
+        seen_urls.add(url)
         title = ""
         if s.title_selector:
-            tnode = node.select_one(s.title_selector) if hasattr(node, "select_one") else None
-            title = (tnode.get_text(" ", strip=True) if tnode else "").strip()
+            tnode = _select_one(node, s.title_selector)
+            title = (_text(tnode) if tnode is not None else "").strip()
         if not title:
-            title = node.get_text(" ", strip=True)[:300]
-
-        published_iso = ""
-        if s.time_selector:
-            tnode = soup.select_one(s.time_selector)
-            if tnode is not None:
-                tval = tnode.get(s.time_attr or "datetime") or tnode.get_text(" ", strip=True)
-                if tval:
-                    if s.time_format:
-                        try:
-                            dt = datetime.strptime(tval, s.time_format).replace(tzinfo=timezone.utc)
-                            published_iso = dt.isoformat()
-                        except Exception:
-                            published_iso = parse_date_to_iso(tval)
-                    else:
-                        published_iso = parse_date_to_iso(tval)
+            title = _text(node)[:300]
 
         out.append({
             "title": title,
             "url": url,
             "published_at": published_iso,
+            "_published_dt": published_dt,
             "summary": "",
         })
         count += 1
@@ -307,28 +410,66 @@ def discover_from_html(text: str, base_url: str, s: Source) -> List[Dict[str, An
     return out
 
 
+_host_locks: Dict[str, threading.Lock] = {}
+_host_locks_guard = threading.Lock()
+_last_hit: Dict[str, float] = {}  # host -> monotonic time the last request finished
+
+
+def host_lock(host: str) -> threading.Lock:
+    """One lock per host, so concurrent workers never hit the same server in parallel."""
+    with _host_locks_guard:
+        lock = _host_locks.get(host)
+        if lock is None:
+            lock = _host_locks[host] = threading.Lock()
+        return lock
+
+
+def polite_fetch(url: str) -> requests.Response:
+    """
+    fetch() with per-host spacing: only sleeps when the same host was hit less than
+    HOST_MIN_GAP_S ago, so sources on different hosts never wait on each other.
+    """
+    host = urlparse(url).netloc.lower()
+    with host_lock(host):
+        wait = HOST_MIN_GAP_S - (time.monotonic() - _last_hit.get(host, float("-inf")))
+        if wait > 0:
+            time.sleep(wait)
+        try:
+            return fetch(url)  # non-streaming: the body is read before the slot is released
+        finally:
+            _last_hit[host] = time.monotonic()
+
+
 def process_source(s: Source, cutoff_utc: datetime) -> List[Dict[str, Any]]:
     items: List[Dict[str, Any]] = []
     try:
-        text, content, headers = fetch(s.url)
-        ctype = headers.get("Content-Type", "")
-        auto_feed = looks_like_feed(text, ctype)
+        r = polite_fetch(s.url)
+        content = r.content
+        ctype = r.headers.get("Content-Type", "")  # case-insensitive lookup
+        auto_feed = looks_like_feed(content, ctype)
         mode = (s.type or "").lower()
         is_feed = (mode == "feed") or (mode == "" and auto_feed)
 
         if is_feed:
-            parsed = discover_from_feed_bytes(content)
+            try:
+                parsed = parse_feed_lxml(content, base=r.url or s.url)
+            except Exception as e:
+                print(f"[discover] lxml feed parse failed for '{s.name}': {e}", file=sys.stderr)
+                parsed = []
+            if not parsed:  # lxml found nothing; let feedparser have a go
+                parsed = discover_from_feed_bytes(content)
             if not parsed:  # feedparser gave nothing; try tolerant XML/HTML
-                parsed = discover_from_html(text, s.url, s)  # will handle xml-as-html too
+                parsed = discover_from_html(r.text, s.url, s)  # will handle xml-as-html too
         else:
-            parsed = discover_from_html(text, s.url, s)
+            parsed = discover_from_html(r.text, s.url, s)
 
         # augment with source name and filter by window
         for it in parsed:
             it["source"] = s.name or (urlparse(s.url).netloc or s.url)
             it["tags"] = list(s.tags or [])
             it["published_at"] = it.get("published_at") or ""
-            if within_window(it["published_at"], cutoff_utc):
+            # parsed once at extraction; internal field, never serialised
+            if within_window(it.pop("_published_dt", None), cutoff_utc):
                 items.append(it)
 
     except Exception as e:
@@ -339,6 +480,9 @@ def process_source(s: Source, cutoff_utc: datetime) -> List[Dict[str, Any]]:
 
 # -------------------------------------- main ---------------------------------------
 
+_WINDOW_RE = re.compile(r"^\s*(\d+)\s*([hdw])\s*$", re.IGNORECASE)
+
+
 def parse_window(win: str) -> timedelta:
     """
     Accepts forms like: 6h, 12h, 1d, 3d, 2w.
@@ -346,7 +490,7 @@ def parse_window(win: str) -> timedelta:
     """
     if not win:
         return timedelta(days=1)
-    m = re.match(r"^\s*(\d+)\s*([hdw])\s*$", win, re.IGNORECASE)
+    m = _WINDOW_RE.match(win)
     if not m:
         return timedelta(days=1)
     n = int(m.group(1))
@@ -395,17 +539,15 @@ def main() -> int:
     all_items: List[Dict[str, Any]] = []
     source_names: List[str] = []
 
-    for s in sources:
-        if not s.enabled:
-            continue
+    # Sources are I/O-bound and independent: fetch them concurrently (map() keeps source order)
+    active = [s for s in sources if s.enabled]
+    with ThreadPoolExecutor(max_workers=max(1, min(DISCOVER_WORKERS, len(active)))) as ex:
+        results = list(ex.map(lambda s: process_source(s, cutoff), active))
+    for s, items in zip(active, results):
         source_names.append(s.name)
-        items = process_source(s, cutoff)
         all_items.extend(items)
         print(f"[discover] {s.name}: +{len(items)} items", file=sys.stderr)
 
-        # be nice to servers
-        time.sleep(0.2)
-
     all_items = dedupe_items(all_items)
 
     payload: Dict[str, Any] = {